@@ -15,23 +15,44 @@ Endpoints:
     GET  /health         - Health check endpoint
 """
 
+import hmac
 import json
 import os
-import sys
+import re
+import stat
+import tempfile
+import threading
 import time
+from datetime import datetime
 from functools import wraps
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
 
-# Add utils path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "utils"))
+# Fast JSON serialization (optional, falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Response compression (optional)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    Compress = None
+    COMPRESS_AVAILABLE = False
 
-from watchdogConfig import WatchdogConfig, reload_config, get_config as get_watchdog_config
+from utils.watchdogConfig import WatchdogConfig, _file_signature, is_truthy, reload_config
 
 # Keycloak authentication (optional)
 try:
-    from keycloak_auth import (
+    from utils.keycloak_auth import (
         get_keycloak_enabled,
         get_keycloak_auth,
         validate_bearer_token,
@@ -49,6 +70,9 @@ except ImportError:
     ROLE_ADMIN = "watchdog:admin"
     ROLE_READ = "watchdog:read"
 
+# KEYCLOAK_ENABLED comes from the process environment only, so resolve it once.
+_KC_ON = KEYCLOAK_AVAILABLE and get_keycloak_enabled()
+
 
 def safe_float(value: Any) -> float:
     """
@@ -68,6 +92,27 @@ def safe_float(value: Any) -> float:
         return 0.0
 
 
+def dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """
+    Walk nested dictionaries along keys, returning default on the first miss.
+
+    Args:
+        data: The (nested) dictionary to read from.
+        *keys: Keys to follow, outermost first.
+        default: Value returned if a key is missing, None or not a dictionary.
+
+    Returns:
+        Any: The value at the end of the key path, or default.
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
 def get_smart_failed_count(disk_smart: Dict[str, Any]) -> int:
     """
     Count the number of failed disks in SMART health data.
@@ -123,7 +168,78 @@ def get_raid_degraded_count(raid_data: Dict[str, Any]) -> int:
     return degraded_count
 
 
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when available.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        str: The JSON document.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_loads(data: Any) -> Any:
+    """Parse a JSON document (str or bytes), using orjson when available.
+
+    Args:
+        data: The JSON document to parse.
+
+    Returns:
+        The parsed object.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON response directly, bypassing jsonify().
+
+    Args:
+        obj: The object to serialize.
+        status: HTTP status code.
+
+    Returns:
+        Response: An application/json response.
+    """
+    if ORJSON_AVAILABLE:
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(obj)
+    return Response(body, status=status, mimetype="application/json")
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (request parsing and jsonify())."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string, honouring the sort_keys setting."""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Parse a JSON string or bytes."""
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+# Responses don't need sorted keys, and the UI is served same-origin (no CORS preflights)
+app.json.sort_keys = False
+app.config["PROVIDE_AUTOMATIC_OPTIONS"] = False
+if COMPRESS_AVAILABLE:
+    # Only JSON bodies above the threshold are compressed; /health stays plain
+    app.config["COMPRESS_MIN_SIZE"] = 500
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+    Compress(app)
 
 # Module-level constants.
 CODE_VERSION = "2.2.0"
@@ -132,6 +248,59 @@ BOOT_ID = os.urandom(4).hex().upper()
 # Configuration
 ENV_FILE_PATH = os.getenv("WATCHDOG_ENV_FILE", "/code/watchdog.env")
 
+# Matches "KEY=value" lines of an env file (comments and blank lines are skipped).
+_ENV_LINE_RE = re.compile(rb"(?m)^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$")
+
+# Matches (possibly commented-out) WATCHDOG_ADMIN_TOKEN assignments, capturing the key part.
+_TOKEN_LINE_RE = re.compile(rb"(?m)^[ \t]*(#?[ \t]*WATCHDOG_ADMIN_TOKEN)[ \t]*=")
+
+# Shared read-only default for missing system_info.json sections.
+_EMPTY: Dict[str, Any] = {}
+
+# Static response bodies, serialized and encoded once at import time. A fresh
+# Response is still built per request because after_request hooks (e.g.
+# Flask-Compress) mutate the response object.
+_HEALTH_BODY = json_dumps({"status": "healthy", "service": "watchdog-admin-api"}).encode("utf-8")
+
+_DEFAULTS_BODY = json_dumps({
+    "success": True,
+    "defaults": {
+        "thresholds": WatchdogConfig.DEFAULT_THRESHOLDS,
+        "messageFrequency": WatchdogConfig.DEFAULT_MESSAGE_FREQUENCY,
+    }
+}).encode("utf-8")
+
+# Parsed config cache, keyed on the env file's mtime (see _cached_config).
+# "auth" pairs the config with its encoded admin token so both are read together.
+_CFG_CACHE: Dict[str, Any] = {"mtime": None, "cfg": None, "auth": (None, b"")}
+_CFG_CACHE_LOCK = threading.Lock()
+
+# Response keys of GET /v1/admin/config and the WatchdogConfig attributes behind them
+_CFG_RESPONSE_KEYS = (
+    "serverName",
+    "glusterNotInstalledHandling",
+    "thresholds",
+    "messageFrequency",
+    "errorChatIds",
+    "warningChatIds",
+    "infoChatIds",
+)
+_CFG_RESPONSE_VALUES = attrgetter(
+    "server_name",
+    "gluster_not_installed_handling",
+    "thresholds",
+    "message_frequency",
+    "error_chat_ids",
+    "warning_chat_ids",
+    "info_chat_ids",
+)
+
+# Raw bytes and parsed key/value lines of watchdog.env for the update handler
+_ENV_CACHE: Dict[str, Any] = {"signature": None, "raw": b"", "entries": None}
+
+# Parsed system_info.json, keyed on its mtime (rewritten by the watchdog once per run)
+_SYS_CACHE: Dict[str, Any] = {"path": None, "mtime": None, "state": None}
+
 
 @app.errorhandler(Exception)
 def handle_exception(e):
@@ -144,61 +313,189 @@ def handle_exception(e):
         JSON response with error details.
     """
     # Pass through HTTP errors
-    from werkzeug.exceptions import HTTPException
     if isinstance(e, HTTPException):
-        return jsonify({"success": False, "error": str(e)}), e.code
+        return json_response({"success": False, "error": str(e)}, e.code)
 
     # Handle non-HTTP exceptions
-    return jsonify({"success": False, "error": f"Internal Server Error: {str(e)}"}), 500
+    return json_response({"success": False, "error": f"Internal Server Error: {str(e)}"}, 500)
 
 
-def get_admin_token() -> str:
-    """Get the admin token from the centralized configuration.
-    Forces a config reload to ensure we have the latest value from watchdog.env.
+def _cached_config() -> WatchdogConfig:
+    """Get the configuration, re-parsing watchdog.env only when it changed.
+
+    The env file is stat'ed on every call and only reloaded when its mtime
+    differs from the one seen at the last load, so UI polling costs a single
+    stat instead of a full read and parse.
 
     Returns:
-        str: The admin authentication token.
+        WatchdogConfig: The cached or freshly reloaded configuration.
     """
-    config = reload_config()
-    token = config.admin_token
-    
+    try:
+        mtime = os.stat(ENV_FILE_PATH).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if _CFG_CACHE["cfg"] is not None and mtime == _CFG_CACHE["mtime"]:
+        return _CFG_CACHE["cfg"]
+
+    # Serialize reloads so concurrent requests don't all re-parse the file
+    with _CFG_CACHE_LOCK:
+        if _CFG_CACHE["cfg"] is not None and mtime == _CFG_CACHE["mtime"]:
+            return _CFG_CACHE["cfg"]
+
+        config = reload_config()
+        _CFG_CACHE.update(
+            mtime=mtime,
+            cfg=config,
+            auth=(config, (config.admin_token or "").encode("utf-8")),
+        )
+        return config
+
+
+def _cached_env_entries() -> Tuple[bytes, Dict[str, str]]:
+    """Get watchdog.env as raw bytes and parsed KEY=value entries.
+
+    Cached on the file's (inode, mtime, size) signature, the same rule the
+    config loader uses, so an in-place edit that keeps the mtime is still
+    picked up as long as the size or inode changes.
+
+    Returns:
+        Tuple[bytes, Dict[str, str]]: The file content and its entries (shared,
+        copy before modifying). Both are empty if the file does not exist.
+    """
+    signature = _file_signature(ENV_FILE_PATH)
+    if signature is None:
+        return b"", {}
+    if _ENV_CACHE["entries"] is not None and signature == _ENV_CACHE["signature"]:
+        return _ENV_CACHE["raw"], _ENV_CACHE["entries"]
+
+    with open(ENV_FILE_PATH, "rb") as f:
+        env_raw = f.read()
+    entries = {
+        match.group(1).decode("utf-8"): match.group(2).decode("utf-8")
+        for match in _ENV_LINE_RE.finditer(env_raw)
+    }
+    _ENV_CACHE.update(raw=env_raw, entries=entries)
+    _ENV_CACHE["signature"] = signature
+    return env_raw, entries
+
+
+def _cached_system_state(system_info_file: str) -> Dict[str, Any]:
+    """Get the parsed system_info.json, re-reading it only when it changed.
+
+    Args:
+        system_info_file: Path to system_info.json.
+
+    Returns:
+        Dict[str, Any]: The parsed system state (shared, must not be mutated).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    mtime = os.stat(system_info_file).st_mtime_ns
+    if mtime == _SYS_CACHE["mtime"] and system_info_file == _SYS_CACHE["path"]:
+        return _SYS_CACHE["state"]
+
+    with open(system_info_file, "rb") as f:
+        system_state = json_loads(f.read())
+    # Store the state before the key so a concurrent reader never pairs a new key with old data
+    _SYS_CACHE["state"] = system_state
+    _SYS_CACHE.update(path=system_info_file, mtime=mtime)
+    return system_state
+
+
+def _admin_auth() -> Tuple[WatchdogConfig, bytes]:
+    """Get the configuration together with its encoded admin token.
+
+    Both come from one cache entry, so a concurrent reload can never pair a
+    token with a different config.
+
+    Returns:
+        Tuple[WatchdogConfig, bytes]: The config and its UTF-8 admin token
+        (empty if none is configured).
+    """
+    _cached_config()
+    config, token = _CFG_CACHE["auth"]
+
     # Debug logging for troubleshooting
-    if os.getenv("DEBUG_WATCHDOG_CONFIG", "false").lower() in ("true", "1", "yes"):
+    if is_truthy(os.getenv("DEBUG_WATCHDOG_CONFIG")):
         print(f"DEBUG: Auth attempt - Admin token configured: {'Yes' if token else 'No'}")
         if token:
             print(f"DEBUG: Token source: {config.get_env_file_path()}")
-            
-    return token
 
+    return config, token
 
-def _validate_token_auth() -> bool:
-    """Validate admin token authentication.
+
+def get_admin_token() -> str:
+    """Get the admin token from the centralized configuration.
+    Uses the mtime-based config cache, so changes to watchdog.env are
+    picked up without re-parsing the file on every request.
 
     Returns:
-        True if token auth succeeds, False otherwise.
+        str: The admin authentication token.
     """
-    admin_token = get_admin_token()
-    if not admin_token:
-        return False
+    return _admin_auth()[0].admin_token
 
+
+def _validate_token_auth() -> Tuple[bool, Optional[Tuple[WatchdogConfig, bytes]]]:
+    """Validate admin token authentication.
+
+    The configured token is only looked up once the request carries one.
+
+    Returns:
+        Tuple[bool, Optional[Tuple[WatchdogConfig, bytes]]]: Whether token auth
+        succeeded, and the (config, token bytes) pair it checked against, or
+        None if the request carried no token.
+    """
     # Check header first, then query parameter
     provided_token = request.headers.get("X-Watchdog-Admin-Token", "")
     if not provided_token:
         provided_token = request.args.get("token", "")
+    if not provided_token:
+        return False, None
+
+    auth = _admin_auth()
+    token = auth[1]
+    if not token:
+        return False, auth
 
-    return provided_token == admin_token
+    # Constant-time compare against the token bytes cached with the config.
+    return hmac.compare_digest(provided_token.encode("utf-8"), token), auth
+
+
+def _token_auth_failure(auth: Optional[Tuple[WatchdogConfig, bytes]]) -> Response:
+    """Build the response for a request that failed authentication.
+
+    Args:
+        auth: The (config, token bytes) pair from _validate_token_auth, or
+            None if it was not looked up yet.
+
+    Returns:
+        Response: 503 if no admin token is configured (and Keycloak is off),
+        401 otherwise.
+    """
+    if not _KC_ON:
+        if auth is None:
+            auth = _admin_auth()
+        if not auth[1]:
+            return json_response({"error": "Admin token not configured"}, 503)
+
+    return json_response({"error": "Unauthorized"}, 401)
 
 
 def _validate_keycloak_auth() -> Optional[KeycloakUser]:
     """Validate Keycloak JWT authentication.
 
+    Only called when Keycloak is enabled (see _keycloak_auth).
+
     Returns:
         KeycloakUser if valid, None otherwise.
     """
-    if not KEYCLOAK_AVAILABLE or not get_keycloak_enabled():
+    auth_header = request.headers.get("Authorization", "")
+    if not auth_header:
         return None
 
-    auth_header = request.headers.get("Authorization", "")
+    # Repeated tokens are served from KeycloakAuth's validated-token cache
     return validate_bearer_token(auth_header)
 
 
@@ -212,15 +509,12 @@ def _check_user_has_role(user: Optional[KeycloakUser], required_roles: List[str]
     Returns:
         True if user has access (token auth or has required role).
     """
-    # Token auth has full access
-    if user is None:
-        return True
+    # Token auth has full access; a Keycloak user only exists when Keycloak is available
+    return user is None or user.has_any_role(required_roles)
 
-    # Check if user has any of the required roles
-    if KEYCLOAK_AVAILABLE and KeycloakUser is not None:
-        return user.has_any_role(required_roles)
 
-    return False
+# Bind the Keycloak step once: when it is disabled the decorators call a no-op.
+_keycloak_auth = _validate_keycloak_auth if _KC_ON else (lambda: None)
 
 
 def require_auth(f):
@@ -238,28 +532,25 @@ def require_auth(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         # Try Keycloak first if enabled
-        keycloak_user = _validate_keycloak_auth()
+        keycloak_user = _keycloak_auth()
         if keycloak_user is not None:
             # User authenticated via Keycloak, check roles
             if not _check_user_has_role(keycloak_user, [ROLE_ADMIN, ROLE_READ]):
-                return jsonify({
+                return json_response({
                     "error": f"Access denied. Required role: {ROLE_READ} or {ROLE_ADMIN}."
-                }), 403
+                }, 403)
             # Store user in request context for later use
             request.keycloak_user = keycloak_user
             return f(*args, **kwargs)
 
         # Fallback to token auth
-        if _validate_token_auth():
+        token_ok, auth = _validate_token_auth()
+        if token_ok:
             request.keycloak_user = None
             return f(*args, **kwargs)
 
         # Neither auth method succeeded
-        admin_token = get_admin_token()
-        if not admin_token and not get_keycloak_enabled():
-            return jsonify({"error": "Admin token not configured"}), 503
-
-        return jsonify({"error": "Unauthorized"}), 401
+        return _token_auth_failure(auth)
 
     return decorated
 
@@ -278,31 +569,79 @@ def require_write_access(f):
     @wraps(f)
     def decorated(*args, **kwargs):
         # Try Keycloak first if enabled
-        keycloak_user = _validate_keycloak_auth()
+        keycloak_user = _keycloak_auth()
         if keycloak_user is not None:
             # User authenticated via Keycloak, check admin role
             if not _check_user_has_role(keycloak_user, [ROLE_ADMIN]):
-                return jsonify({
+                return json_response({
                     "error": f"Access denied. Required role: {ROLE_ADMIN}. Write operations require admin privileges."
-                }), 403
+                }, 403)
             request.keycloak_user = keycloak_user
             return f(*args, **kwargs)
 
         # Fallback to token auth (has full access)
-        if _validate_token_auth():
+        token_ok, auth = _validate_token_auth()
+        if token_ok:
             request.keycloak_user = None
             return f(*args, **kwargs)
 
         # Neither auth method succeeded
-        admin_token = get_admin_token()
-        if not admin_token and not get_keycloak_enabled():
-            return jsonify({"error": "Admin token not configured"}), 503
-
-        return jsonify({"error": "Unauthorized"}), 401
+        return _token_auth_failure(auth)
 
     return decorated
 
 
+def _write_env_file(payload: str) -> None:
+    """Write the env file (UTF-8) atomically via a fsync'ed temp file and os.replace().
+
+    Falls back to an in-place write when the file cannot be replaced, e.g.
+    when watchdog.env is a single-file Docker bind mount (rename fails with
+    EBUSY) or its directory is not writable.
+
+    Args:
+        payload: The complete new file content.
+
+    Raises:
+        PermissionError: If the env file itself is not writable.
+    """
+    data = payload.encode("utf-8")
+    # The file holds the admin token: keep its permissions and owner, default to owner-only
+    try:
+        st = os.stat(ENV_FILE_PATH)
+    except OSError:
+        st = None
+    tmp_path = None
+    try:
+        # Unique temp file per save, so concurrent saves never share one
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(ENV_FILE_PATH) or ".", prefix=".watchdog.env.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), stat.S_IMODE(st.st_mode) if st is not None else 0o600)
+            if st is not None:
+                try:
+                    os.fchown(f.fileno(), st.st_uid, st.st_gid)
+                except OSError:
+                    pass  # Changing the owner needs privileges; keep the mode at least
+            f.write(data)
+            f.flush()
+            # Make sure the content is on disk before the rename publishes it
+            os.fsync(f.fileno())
+        os.replace(tmp_path, ENV_FILE_PATH)
+        return
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    with open(ENV_FILE_PATH, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint for container orchestration.
@@ -310,7 +649,7 @@ def health_check():
     Returns:
         JSON response with health status.
     """
-    return jsonify({"status": "healthy", "service": "watchdog-admin-api"})
+    return Response(_HEALTH_BODY, mimetype="application/json")
 
 
 @app.route("/v1/admin/config", methods=["GET"])
@@ -322,23 +661,16 @@ def handle_get_config():
         JSON response with current configuration values.
     """
     try:
-        config = reload_config()
-        return jsonify({
+        config = _cached_config()
+        env_file_path = config.get_env_file_path()
+        return json_response({
             "success": True,
-            "config": {
-                "serverName": config.server_name,
-                "glusterNotInstalledHandling": config.gluster_not_installed_handling,
-                "thresholds": config.thresholds,
-                "messageFrequency": config.message_frequency,
-                "errorChatIds": config.error_chat_ids,
-                "warningChatIds": config.warning_chat_ids,
-                "infoChatIds": config.info_chat_ids,
-            },
-            "envFilePath": config.get_env_file_path(),
-            "envFileExists": os.path.isfile(config.get_env_file_path()),
+            "config": dict(zip(_CFG_RESPONSE_KEYS, _CFG_RESPONSE_VALUES(config))),
+            "envFilePath": env_file_path,
+            "envFileExists": os.path.isfile(env_file_path),
         })
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 @app.route("/v1/admin/config", methods=["POST"])
@@ -354,17 +686,11 @@ def handle_update_config():
     try:
         data = request.get_json()
         if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
+            return json_response({"success": False, "error": "No data provided"}, 400)
 
         # Read existing env file content to preserve untracked keys (like WATCHDOG_ADMIN_TOKEN)
-        env_content = {}
-        if os.path.isfile(ENV_FILE_PATH):
-            with open(ENV_FILE_PATH, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, _, value = line.partition("=")
-                        env_content[key.strip()] = value.strip()
+        env_raw, env_entries = _cached_env_entries()
+        env_content = dict(env_entries)
 
         # Update with new values from UI
         if "serverName" in data:
@@ -374,40 +700,51 @@ def handle_update_config():
             env_content["gluster_not_installed_handling"] = data["glusterNotInstalledHandling"]
 
         if "thresholds" in data:
-            env_content["WATCHDOG_THRESHOLDS_JSON"] = json.dumps(data["thresholds"])
+            env_content["WATCHDOG_THRESHOLDS_JSON"] = json_dumps(data["thresholds"])
 
         if "messageFrequency" in data:
-            env_content["WATCHDOG_MESSAGE_FREQUENCY_JSON"] = json.dumps(data["messageFrequency"])
+            env_content["WATCHDOG_MESSAGE_FREQUENCY_JSON"] = json_dumps(data["messageFrequency"])
 
         if "errorChatIds" in data:
-            env_content["errorChatIDs"] = ",".join(data["errorChatIds"])
+            env_content["errorChatIDs"] = ",".join(map(str, data["errorChatIds"]))
 
         if "warningChatIds" in data:
-            env_content["warningChatIDs"] = ",".join(data["warningChatIds"])
+            env_content["warningChatIDs"] = ",".join(map(str, data["warningChatIds"]))
 
         if "infoChatIds" in data:
-            env_content["infoChatIDs"] = ",".join(data["infoChatIds"])
-
-        # Write back to env file
-        with open(ENV_FILE_PATH, "w") as f:
-            f.write("# Server Info Watchdog Configuration\n")
-            f.write("# Updated via Admin API\n\n")
-            # Sort keys to keep file organized
-            for key in sorted(env_content.keys()):
-                f.write(f"{key}={env_content[key]}\n")
-
-        # Force a fresh reload of the global config instance
-        reload_config()
-
-        return jsonify({"success": True, "message": "Configuration updated"})
+            env_content["infoChatIDs"] = ",".join(map(str, data["infoChatIds"]))
+
+        # Write back to env file (sort keys to keep file organized)
+        lines = ["# Server Info Watchdog Configuration", "# Updated via Admin API", ""]
+        lines.extend(f"{key}={env_content[key]}" for key in sorted(env_content))
+        payload = "\n".join(lines) + "\n"
+
+        # Skip the write (and the mtime bump) when nothing changed
+        data = payload.encode("utf-8")
+        if data != env_raw:
+            _write_env_file(payload)
+            # Seed the env cache with what was written and force a config
+            # reload: an in-place write within one mtime tick can keep the
+            # file's inode, mtime and size, so change detection would miss it
+            _ENV_CACHE.update(raw=data, entries=env_content)
+            _ENV_CACHE["signature"] = _file_signature(ENV_FILE_PATH)
+            with _CFG_CACHE_LOCK:
+                config = reload_config(force=True)
+                _CFG_CACHE.update(
+                    mtime=None,
+                    cfg=config,
+                    auth=(config, (config.admin_token or "").encode("utf-8")),
+                )
+
+        return json_response({"success": True, "message": "Configuration updated"})
 
     except PermissionError:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": "Permission denied. Env file may be mounted read-only."
-        }), 403
+        }, 403)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 @app.route("/v1/admin/config/defaults", methods=["GET"])
@@ -418,13 +755,7 @@ def handle_get_defaults():
     Returns:
         JSON response with default threshold and frequency values.
     """
-    return jsonify({
-        "success": True,
-        "defaults": {
-            "thresholds": WatchdogConfig.DEFAULT_THRESHOLDS,
-            "messageFrequency": WatchdogConfig.DEFAULT_MESSAGE_FREQUENCY,
-        }
-    })
+    return Response(_DEFAULTS_BODY, mimetype="application/json")
 
 
 @app.route("/v1/admin/system-state", methods=["GET"])
@@ -439,110 +770,123 @@ def handle_get_system_state():
         server_info_path = os.getenv("SERVER_INFO_PATH", "/code/serverInfo")
         system_info_file = os.path.join(server_info_path, "system_info.json")
         
-        if not os.path.isfile(system_info_file):
-            return jsonify({
+        # Read current system state (cached until the watchdog rewrites the file)
+        try:
+            system_state = _cached_system_state(system_info_file)
+        except FileNotFoundError:
+            return json_response({
                 "success": False,
                 "error": "System info file not found",
                 "path": system_info_file
-            }), 404
-        
-        # Read current system state
-        with open(system_info_file, 'r') as f:
-            system_state = json.load(f)
+            }, 404)
         
         # Get current thresholds from config
-        config = get_watchdog_config()
-        thresholds = getattr(config, 'thresholds', {})
+        config = _cached_config()
+        thresholds = config.thresholds
         
         # Combine current state with thresholds for easy comparison
         response = {
             "success": True,
             "data": {
-                "timestamp": system_state.get("timestamp", {}).get("human_readable_format"),
-                "serverName": system_state.get("system_info", {}).get("hostname"),
+                "timestamp": dig(system_state, "timestamp", "human_readable_format"),
+                "serverName": dig(system_state, "system_info", "hostname"),
                 "current": {
-                    "cpu": float(system_state.get("cpu", {}).get("last_15min_cpu_percentage", 0)),
-                    "disk": float(system_state.get("disk", {}).get("disk_usage_percentage", "0").replace('%', '')),
-                    "memory": float(system_state.get("memory", {}).get("memory_usage_percentage", 0)),
-                    "processes": int(system_state.get("processes", {}).get("amount_processes", 0)),
-                    "users": int(system_state.get("users", {}).get("logged_in_users", 0)),
-                    "updates": int(system_state.get("updates", {}).get("amount_of_available_updates", 0)),
-                    "system_restart": int(int(system_state.get("system_restart", {}).get("time_elapsed_seconds", 0) or 0) / 86400),
-                    "linux_server_state_tool": int(system_state.get("linux_server_state_tool", {}).get("behind_count", 0)),
-                    "gluster_unhealthy_peers": int(system_state.get("gluster", {}).get("number_of_unhealthy_peers", 0)),
-                    "gluster_unhealthy_volumes": int(system_state.get("gluster", {}).get("number_of_unhealthy_volumes", 0)),
-                    "kernel_versions_behind": int(system_state.get("kernel", {}).get("versions_behind", 0)),
-                    "network_up": float(system_state.get("network", {}).get("upstream_avg_bits", 0)),
-                    "network_down": float(system_state.get("network", {}).get("downstream_avg_bits", 0)),
-                    "network_total": float(system_state.get("network", {}).get("total_network_avg_bits", 0)),
-                    "timestampAgeMinutes": int((time.time() - int(system_state.get("timestamp", {}).get("unix_format", 0))) / 60),
+                    "cpu": float(dig(system_state, "cpu", "last_15min_cpu_percentage", default=0)),
+                    "disk": float(dig(system_state, "disk", "disk_usage_percentage", default="0").replace('%', '')),
+                    "memory": float(dig(system_state, "memory", "memory_usage_percentage", default=0)),
+                    "processes": int(dig(system_state, "processes", "amount_processes", default=0)),
+                    "users": int(dig(system_state, "users", "logged_in_users", default=0)),
+                    "updates": int(dig(system_state, "updates", "amount_of_available_updates", default=0)),
+                    "system_restart": int(int(dig(system_state, "system_restart", "time_elapsed_seconds", default=0) or 0) / 86400),
+                    "linux_server_state_tool": int(dig(system_state, "linux_server_state_tool", "behind_count", default=0)),
+                    "gluster_unhealthy_peers": int(dig(system_state, "gluster", "number_of_unhealthy_peers", default=0)),
+                    "gluster_unhealthy_volumes": int(dig(system_state, "gluster", "number_of_unhealthy_volumes", default=0)),
+                    "kernel_versions_behind": int(dig(system_state, "kernel", "versions_behind", default=0)),
+                    "network_up": float(dig(system_state, "network", "upstream_avg_bits", default=0)),
+                    "network_down": float(dig(system_state, "network", "downstream_avg_bits", default=0)),
+                    "network_total": float(dig(system_state, "network", "total_network_avg_bits", default=0)),
+                    "timestampAgeMinutes": int((time.time() - int(dig(system_state, "timestamp", "unix_format", default=0))) / 60),
                     # Hardware metrics
-                    "temperature_cpu": safe_float(system_state.get("hardware", {}).get("cpu_temperature_celsius", "N/A")),
-                    "temperature_gpu": safe_float(system_state.get("hardware", {}).get("gpu_temperature_celsius", "N/A")),
-                    "fan_speed": safe_float(system_state.get("hardware", {}).get("fan_speed_rpm", "N/A")),
+                    "temperature_cpu": safe_float(dig(system_state, "hardware", "cpu_temperature_celsius")),
+                    "temperature_gpu": safe_float(dig(system_state, "hardware", "gpu_temperature_celsius")),
+                    "fan_speed": safe_float(dig(system_state, "hardware", "fan_speed_rpm")),
                     # Performance metrics
-                    "io_wait": safe_float(system_state.get("io_wait", {}).get("io_wait_percentage", "N/A")),
-                    "file_descriptors": safe_float(system_state.get("file_descriptors", {}).get("usage_percent", "N/A")),
+                    "io_wait": safe_float(dig(system_state, "io_wait", "io_wait_percentage")),
+                    "file_descriptors": safe_float(dig(system_state, "file_descriptors", "usage_percent")),
                     # Storage health
-                    "smart_health_failed": get_smart_failed_count(system_state.get("disk_smart", {})),
+                    "smart_health_failed": get_smart_failed_count(dig(system_state, "disk_smart", default=_EMPTY)),
                     # Storage arrays
-                    "zfs_pool_degraded": get_zfs_degraded_count(system_state.get("storage_arrays", {}).get("zfs", {})),
-                    "raid_array_degraded": get_raid_degraded_count(system_state.get("storage_arrays", {}).get("raid", {})),
+                    "zfs_pool_degraded": get_zfs_degraded_count(dig(system_state, "storage_arrays", "zfs", default=_EMPTY)),
+                    "raid_array_degraded": get_raid_degraded_count(dig(system_state, "storage_arrays", "raid", default=_EMPTY)),
                     # Time sync
-                    "ntp_offset_ms": safe_float(system_state.get("ntp_sync", {}).get("offset_ms", "N/A")),
+                    "ntp_offset_ms": safe_float(dig(system_state, "ntp_sync", "offset_ms")),
                 },
                 "thresholds": thresholds
             }
         }
         
-        return jsonify(response)
+        return json_response(response)
         
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 if __name__ == "__main__":
     port = int(os.getenv("ADMIN_API_PORT", "5000"))
-    debug = os.getenv("FLASK_DEBUG", "false").lower() in ("true", "1", "yes")
-    
-    # Force a reload at startup to get latest values
-    config = reload_config()
-    
+    debug = is_truthy(os.getenv("FLASK_DEBUG"))
+    verbose_boot = is_truthy(os.getenv("WATCHDOG_VERBOSE_BOOT"))
+
     print("=" * 60)
     print(f"🚀 SERVER INFO WATCHDOG - ADMIN API (v{CODE_VERSION})")
     print(f"   Boot ID: {BOOT_ID}")
-    print(f"   Time: {os.popen('date').read().strip()}")
+    print(f"   Time: {datetime.now().isoformat(timespec='seconds')}")
     print(f"   Port: {port}")
-    print(f"   Working Dir: {os.getcwd()}")
-    print(f"   Config File Path: {config.get_env_file_path()}")
-    print(f"   File Exists: {'✅ Yes' if os.path.isfile(config.get_env_file_path()) else '❌ No'}")
-    
-    # Log ALL environment variables starting with WATCHDOG_
-    print("   --- Environment Scan ---")
-    for key, val in os.environ.items():
-        if key.startswith("WATCHDOG_"):
-            masked_val = "[MASKED]" if "TOKEN" in key.upper() else val
-            print(f"   - {key}={masked_val}")
-
-    if os.path.isfile(config.get_env_file_path()):
-        try:
-            with open(config.get_env_file_path(), 'r') as f:
-                lines = f.readlines()
-                token_lines = [l for l in lines if "WATCHDOG_ADMIN_TOKEN" in l]
+
+    # Config diagnostics are opt-in; otherwise the config is loaded on the first request.
+    if verbose_boot:
+        config = _cached_config()
+
+        print(f"   Working Dir: {os.getcwd()}")
+        print(f"   Config File Path: {config.get_env_file_path()}")
+        print(f"   File Exists: {'✅ Yes' if os.path.isfile(config.get_env_file_path()) else '❌ No'}")
+
+        # Log ALL environment variables starting with WATCHDOG_
+        print("   --- Environment Scan ---")
+        for key, val in os.environ.items():
+            if key.startswith("WATCHDOG_"):
+                masked_val = "[MASKED]" if "TOKEN" in key.upper() else val
+                print(f"   - {key}={masked_val}")
+
+        if os.path.isfile(config.get_env_file_path()):
+            try:
+                with open(config.get_env_file_path(), 'rb') as f:
+                    token_prefixes = _TOKEN_LINE_RE.findall(f.read())
                 print(f"   --- File Scan ({config.get_env_file_path()}) ---")
-                print(f"   Token lines found: {len(token_lines)}")
-                for tl in token_lines:
-                    prefix = tl.strip().split('=')[0]
-                    is_commented = tl.strip().startswith("#")
-                    print(f"   - {prefix} (Commented: {is_commented})")
-        except Exception as e:
-            print(f"   Error reading file: {e}")
-
-    token_status = "[CONFIGURED]" if config.admin_token else "[MISSING - LOGIN WILL FAIL]"
-    print(f"   Final Resolved Admin Token Status: {token_status}")
-    
-    if not config.admin_token:
-        print("\n⚠️  CRITICAL: WATCHDOG_ADMIN_TOKEN is resolved as EMPTY!")
+                print(f"   Token lines found: {len(token_prefixes)}")
+                for prefix in token_prefixes:
+                    is_commented = prefix.startswith(b"#")
+                    print(f"   - {prefix.decode('utf-8')} (Commented: {is_commented})")
+            except Exception as e:
+                print(f"   Error reading file: {e}")
+
+        token_status = "[CONFIGURED]" if config.admin_token else "[MISSING - LOGIN WILL FAIL]"
+        print(f"   Final Resolved Admin Token Status: {token_status}")
+
+        if not config.admin_token:
+            print("\n⚠️  CRITICAL: WATCHDOG_ADMIN_TOKEN is resolved as EMPTY!")
+    else:
+        print("   Config diagnostics: set WATCHDOG_VERBOSE_BOOT=true to print them at startup")
     print("=" * 60)
-    
-    app.run(host="0.0.0.0", port=port, debug=debug)
+
+    # The Werkzeug dev server handles one request at a time; only use it for debugging.
+    if debug:
+        app.run(host="0.0.0.0", port=port, debug=debug)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("⚠️  waitress not installed, falling back to the Flask development server")
+            app.run(host="0.0.0.0", port=port)
+        else:
+            threads = int(os.getenv("ADMIN_API_THREADS", "8"))
+            serve(app, host="0.0.0.0", port=port, threads=threads)
@@ -0,0 +1 @@
+## Shared utility modules (importable as the "utils" package by admin_api.py).
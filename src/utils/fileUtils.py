@@ -6,6 +6,9 @@ import os
 # For string sanitization.
 import re
 
+# Characters that are not allowed in generated filenames.
+_INVALID_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9.\-_]")
+
 def createFileIfNotExists(fileToCreateIfNotExists):
 	"""Create a file (and its parent directories) if it does not exist.
 
@@ -15,31 +18,40 @@ def createFileIfNotExists(fileToCreateIfNotExists):
 	Returns:
 		None: This function has no return value.
 
+	Raises:
+		ValueError: If the path does not contain a directory component.
+
 	Note:
-		Uses a portable create strategy (open in append mode) rather than
+		Uses a portable create strategy (os.open with O_CREAT) rather than
 		os.mknod, because some filesystems/bind-mounts do not support mknod.
+		Creation is attempted directly instead of checking os.path.exists
+		first, so an existing directory/file costs no extra stat call.
 	"""
 	# Seperate directory from filename.
-	if "/" in fileToCreateIfNotExists:
-		lastSlashPosition = fileToCreateIfNotExists.rfind("/")
-
-		directoryName = fileToCreateIfNotExists[0:(lastSlashPosition)]
-		if not os.path.exists(directoryName):
-			os.makedirs(directoryName)
-			try:
-				os.chmod(directoryName, 0o775)
-			except Exception:
-				pass
-
-		if not os.path.exists(fileToCreateIfNotExists):
-			with open(fileToCreateIfNotExists, 'a+', encoding='utf-8'):
-				pass
-			try:
-				os.chmod(fileToCreateIfNotExists, 0o775)
-			except Exception:
-				pass
+	directoryName, _ = os.path.split(fileToCreateIfNotExists)
+	if not directoryName:
+		raise ValueError("Cannot create a file without directory (pass filename containing filepath like \"path/to/file.txt\")")
+
+	try:
+		os.makedirs(directoryName, mode=0o775)
+	except FileExistsError:
+		pass
 	else:
-		print("Cannot create a file without directory (pass filename containing filepath like \"path/to/file.txt\")")
+		# The umask masks the makedirs/open mode, so chmod newly created entries.
+		try:
+			os.chmod(directoryName, 0o775)
+		except OSError:
+			pass
+
+	try:
+		fd = os.open(fileToCreateIfNotExists, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o775)
+	except FileExistsError:
+		return
+	os.close(fd)
+	try:
+		os.chmod(fileToCreateIfNotExists, 0o775)
+	except OSError:
+		pass
 
 
 # Get a valid filename for a string.
@@ -53,9 +65,7 @@ def getValidFileNameForString(stringToConvertToFileName, fileType):
 	Returns:
 		str: Sanitized filename with the provided extension.
 	"""
-	whiteListedCharactersRegEx = "[^a-zA-Z0-9.\-_]"
-	validFilename = re.sub(whiteListedCharactersRegEx, '', str(stringToConvertToFileName) )
-	validFilename = validFilename[:100]
+	validFilename = _INVALID_FILENAME_CHARS.sub('', str(stringToConvertToFileName))[:100]
 
 	validFilename += "." + str(fileType)
 	return validFilename
@@ -71,10 +81,18 @@ def readStringFromFile(fileToReadStringFrom):
 	Returns:
 		str: File content with trailing whitespace removed.
 	"""
-	string = ""
-	with open(fileToReadStringFrom, 'r') as file:
-		string = file.read().rstrip()
-	return string
+	# Raw fd read: these state/timestamp files are tiny, so skip the buffered text layer.
+	fd = os.open(fileToReadStringFrom, os.O_RDONLY)
+	try:
+		data = os.read(fd, os.fstat(fd).st_size or 4096)
+		while True:
+			chunk = os.read(fd, 65536)
+			if not chunk:
+				break
+			data += chunk
+	finally:
+		os.close(fd)
+	return data.decode('utf-8').rstrip()
 
 
 # Overwrite string of file.
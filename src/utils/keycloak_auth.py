@@ -12,10 +12,16 @@ Dependencies:
 """
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
+import sys
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 try:
     import jwt
@@ -26,6 +32,50 @@ except ImportError:
     PyJWKClient = None
     PyJWKClientError = Exception
 
+logger = logging.getLogger(__name__)
+
+# Upper bound of validated tokens kept per KeycloakAuth instance.
+CLAIMS_CACHE_MAX_ENTRIES = 4096
+
+# Seconds a rejected token is answered from the cache without re-verifying it,
+# and the upper bound of rejected tokens remembered.
+NEGATIVE_CACHE_TTL = 2
+NEGATIVE_CACHE_MAX_ENTRIES = 4096
+
+# Claims kept in KeycloakUser.raw_token (the full payload is dropped after extraction).
+RAW_TOKEN_CLAIMS = ("sub", "preferred_username", "email", "exp")
+
+# Seconds a fetched JWKS / signing key is reused before asking Keycloak again.
+# Older keys are still served while a background refresh runs, up to
+# JWKS_MAX_STALENESS seconds, after which the fetch happens synchronously.
+JWKS_CACHE_LIFESPAN = 300
+JWKS_MAX_STALENESS = 3600
+
+
+# Keycloak settings come from the process environment only, so they are
+# resolved once at import instead of on every authenticated request.
+_KC_ENABLED = False
+_KC_URL = ""
+_KC_REALM = ""
+_KC_CLIENT_ID = ""
+_KC_INTERNAL_URL: Optional[str] = None
+_KC_ALLOWED_ALGS: List[str] = []
+
+
+def _reload_env() -> None:
+    """Re-read the KEYCLOAK_* environment variables into the module settings."""
+    global _KC_ENABLED, _KC_URL, _KC_REALM, _KC_CLIENT_ID, _KC_INTERNAL_URL, _KC_ALLOWED_ALGS
+    _KC_ENABLED = os.environ.get("KEYCLOAK_ENABLED", "false").lower() in ("true", "1", "yes")
+    _KC_URL = os.environ.get("KEYCLOAK_URL", "http://localhost:9090")
+    _KC_REALM = os.environ.get("KEYCLOAK_REALM", "watchdog")
+    _KC_CLIENT_ID = os.environ.get("KEYCLOAK_CLIENT_ID", "watchdog-backend")
+    _KC_INTERNAL_URL = os.environ.get("KEYCLOAK_INTERNAL_URL") or None
+    algs = os.environ.get("KEYCLOAK_ALLOWED_ALGS", "RS256,EdDSA,ES256")
+    _KC_ALLOWED_ALGS = [alg.strip() for alg in algs.split(",") if alg.strip()]
+
+
+_reload_env()
+
 
 def get_keycloak_enabled() -> bool:
     """
@@ -34,8 +84,7 @@ def get_keycloak_enabled() -> bool:
     Returns:
         bool: True if KEYCLOAK_ENABLED is set to 'true' (case-insensitive).
     """
-    val = os.environ.get("KEYCLOAK_ENABLED", "false")
-    return val.lower() in ("true", "1", "yes")
+    return _KC_ENABLED
 
 
 def get_keycloak_url() -> str:
@@ -45,7 +94,7 @@ def get_keycloak_url() -> str:
     Returns:
         str: Keycloak URL.
     """
-    return os.environ.get("KEYCLOAK_URL", "http://localhost:9090")
+    return _KC_URL
 
 
 def get_keycloak_realm() -> str:
@@ -55,7 +104,7 @@ def get_keycloak_realm() -> str:
     Returns:
         str: Realm name.
     """
-    return os.environ.get("KEYCLOAK_REALM", "watchdog")
+    return _KC_REALM
 
 
 def get_keycloak_client_id() -> str:
@@ -65,7 +114,7 @@ def get_keycloak_client_id() -> str:
     Returns:
         str: Client ID.
     """
-    return os.environ.get("KEYCLOAK_CLIENT_ID", "watchdog-backend")
+    return _KC_CLIENT_ID
 
 
 def get_keycloak_client_secret() -> Optional[str]:
@@ -87,7 +136,7 @@ def get_keycloak_client_secret() -> Optional[str]:
                 if secret:
                     return secret
         except Exception as e:
-            print(f"[KEYCLOAK] Warning: Could not read secret file {secret_file}: {e}")
+            logger.warning("[KEYCLOAK] Could not read secret file %s: %s", secret_file, e)
     
     # Fall back to environment variable
     return os.environ.get("KEYCLOAK_CLIENT_SECRET") or None
@@ -100,10 +149,29 @@ def get_keycloak_internal_url() -> Optional[str]:
     Returns:
         Optional[str]: Internal URL or None.
     """
-    return os.environ.get("KEYCLOAK_INTERNAL_URL") or None
+    return _KC_INTERNAL_URL
+
+
+def get_keycloak_allowed_algorithms() -> List[str]:
+    """
+    Get the JWS algorithms accepted for access tokens from environment.
+
+    KEYCLOAK_ALLOWED_ALGS is a comma-separated list (default: RS256,EdDSA,ES256).
+    Signing keys always come from the realm's JWKS, so this only decides which
+    of the realm's key types are accepted. Ed25519 (EdDSA) verification is much
+    cheaper than RS256 and is worth enabling in the realm for busy deployments.
+
+    Returns:
+        List[str]: Allowed algorithm names.
+    """
+    return _KC_ALLOWED_ALGS
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__.
+_SLOTS_OPTION: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(eq=False, **_SLOTS_OPTION)
 class KeycloakUser:
     """
     Represents an authenticated Keycloak user.
@@ -117,8 +185,9 @@ class KeycloakUser:
         given_name: User's first name
         family_name: User's last name
         roles: List of realm roles assigned to the user
-        token_exp: Token expiration timestamp
-        raw_token: The raw JWT token payload
+        token_exp: Token expiration as unix timestamp (see token_exp_dt)
+        raw_token: Subset of the JWT payload (sub, preferred_username, email,
+            exp), or the full payload when validated with retain_raw=True
     """
 
     sub: str
@@ -129,8 +198,25 @@ class KeycloakUser:
     given_name: str = ""
     family_name: str = ""
     roles: List[str] = field(default_factory=list)
-    token_exp: Optional[datetime] = None
+    token_exp: Optional[float] = None
     raw_token: Dict[str, Any] = field(default_factory=dict)
+    _role_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the role set used by the role checks."""
+        self._role_set = frozenset(self.roles)
+
+    @property
+    def token_exp_dt(self) -> Optional[datetime]:
+        """
+        Token expiration as timezone-aware UTC datetime, built on access.
+
+        Returns:
+            The expiration datetime, or None if the token has no exp claim.
+        """
+        if self.token_exp is None:
+            return None
+        return datetime.fromtimestamp(self.token_exp, tz=timezone.utc)
 
     def has_role(self, role: str) -> bool:
         """
@@ -142,7 +228,7 @@ class KeycloakUser:
         Returns:
             True if user has the role, False otherwise.
         """
-        return role in self.roles
+        return role in self._role_set
 
     def has_any_role(self, roles: List[str]) -> bool:
         """
@@ -154,7 +240,7 @@ class KeycloakUser:
         Returns:
             True if user has at least one of the roles.
         """
-        return bool(set(self.roles) & set(roles))
+        return any(role in self._role_set for role in roles)
 
 
 class KeycloakAuth:
@@ -171,6 +257,7 @@ class KeycloakAuth:
         client_id: str,
         client_secret: Optional[str] = None,
         internal_url: Optional[str] = None,
+        allowed_algorithms: Optional[List[str]] = None,
     ):
         """
         Initialize the Keycloak authentication handler.
@@ -181,11 +268,13 @@ class KeycloakAuth:
             client_id: Client ID for the backend application
             client_secret: Client secret (optional, for confidential clients)
             internal_url: Internal URL for JWKS fetching (e.g., http://keycloak:9090 in Docker)
+            allowed_algorithms: Accepted JWS algorithms (default: RS256 only)
         """
         self.keycloak_url = keycloak_url.rstrip("/")
         self.realm = realm
         self.client_id = client_id
         self.client_secret = client_secret
+        self.allowed_algorithms = list(allowed_algorithms or ["RS256"])
 
         # Use internal URL for API calls if provided, otherwise use public URL
         self.internal_url = (internal_url or keycloak_url).rstrip("/")
@@ -197,6 +286,22 @@ class KeycloakAuth:
         # Initialize JWKS client (lazy loading)
         self._jwks_client: Optional[Any] = None
 
+        # Validated users keyed by a hash of the raw token, stored with the
+        # token's expiry timestamp. Tokens are verified locally (signature and
+        # exp, no introspection), so caching until exp accepts exactly the same
+        # tokens; only a key removed from the realm's JWKS is noticed later.
+        self._claims_cache: "OrderedDict[bytes, Tuple[KeycloakUser, float]]" = OrderedDict()
+        self._claims_cache_lock = threading.Lock()
+
+        # Recently rejected tokens (same key) with the error and its expiry, so
+        # floods of garbage or tampered tokens cost a lookup instead of a verify
+        self._rejected_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+
+        # Signing keys by JWS "kid" with the time they were fetched
+        self._kid_cache: Dict[str, Tuple[Any, float]] = {}
+        self._kid_cache_lock = threading.Lock()
+        self._kid_refreshing = False
+
     @property
     def jwks_client(self) -> Any:
         """
@@ -211,9 +316,67 @@ class KeycloakAuth:
         if self._jwks_client is None:
             if not JWT_AVAILABLE or PyJWKClient is None:
                 raise RuntimeError("JWT library not available. Install PyJWT[crypto].")
-            self._jwks_client = PyJWKClient(self.jwks_uri, cache_keys=True)
+            self._jwks_client = PyJWKClient(
+                self.jwks_uri,
+                cache_keys=True,
+                max_cached_keys=16,
+                lifespan=JWKS_CACHE_LIFESPAN,
+            )
         return self._jwks_client
 
+    def _get_signing_key(self, token: str) -> Any:
+        """
+        Get the public key for a token, cached by its "kid" header.
+
+        Args:
+            token: JWT access token string.
+
+        Returns:
+            The public key to verify the token's signature with.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid is None:
+            return self.jwks_client.get_signing_key_from_jwt(token).key
+
+        now = time.time()
+        with self._kid_cache_lock:
+            entry = self._kid_cache.get(kid)
+            if entry is not None:
+                age = now - entry[1]
+                if age < JWKS_CACHE_LIFESPAN:
+                    return entry[0]
+                # Stale: keep serving it and revalidate in the background
+                if age < JWKS_MAX_STALENESS:
+                    if not self._kid_refreshing:
+                        self._kid_refreshing = True
+                        threading.Thread(target=self._refresh_signing_keys, daemon=True).start()
+                    return entry[0]
+
+        # Unknown kid (e.g. key rotation) or too stale: fetch synchronously
+        key = self.jwks_client.get_signing_key(kid).key
+        with self._kid_cache_lock:
+            self._kid_cache[kid] = (key, now)
+        return key
+
+    def _refresh_signing_keys(self) -> None:
+        """
+        Re-fetch the realm's JWKS and replace the kid cache (background thread).
+
+        Keys that are no longer published are dropped. On failure the stale
+        entries are kept until JWKS_MAX_STALENESS forces a synchronous fetch.
+        """
+        try:
+            signing_keys = self.jwks_client.get_signing_keys(refresh=True)
+            now = time.time()
+            kid_cache = {k.key_id: (k.key, now) for k in signing_keys if k.key_id}
+            with self._kid_cache_lock:
+                self._kid_cache = kid_cache
+        except Exception as e:
+            logger.warning("[KEYCLOAK] JWKS refresh failed: %s", e)
+        finally:
+            with self._kid_cache_lock:
+                self._kid_refreshing = False
+
     def _extract_roles(self, token_payload: Dict[str, Any]) -> List[str]:
         """
         Extract realm roles from the token payload.
@@ -224,44 +387,38 @@ class KeycloakAuth:
         Returns:
             List of role names.
         """
-        roles = []
+        # dict keys dedupe in one pass while preserving first-seen order
+        roles: Dict[str, None] = {}
 
         # Try to get roles from the 'roles' claim (custom mapper)
-        if "roles" in token_payload:
-            claim_roles = token_payload["roles"]
-            if isinstance(claim_roles, list):
-                roles.extend(claim_roles)
-            elif isinstance(claim_roles, str):
-                roles.append(claim_roles)
+        claim_roles = token_payload.get("roles")
+        if isinstance(claim_roles, str):
+            roles[claim_roles] = None
+        elif isinstance(claim_roles, list):
+            roles.update(dict.fromkeys(claim_roles))
 
         # Also check realm_access.roles (default Keycloak structure)
-        realm_access = token_payload.get("realm_access", {})
-        if isinstance(realm_access, dict) and "roles" in realm_access:
-            roles.extend(realm_access["roles"])
+        realm_access = token_payload.get("realm_access")
+        if isinstance(realm_access, dict):
+            roles.update(dict.fromkeys(realm_access.get("roles") or ()))
 
         # Also check resource_access for client-specific roles
-        resource_access = token_payload.get("resource_access", {})
+        resource_access = token_payload.get("resource_access")
         if isinstance(resource_access, dict):
             for client_roles in resource_access.values():
-                if isinstance(client_roles, dict) and "roles" in client_roles:
-                    roles.extend(client_roles["roles"])
+                if isinstance(client_roles, dict):
+                    roles.update(dict.fromkeys(client_roles.get("roles") or ()))
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_roles = []
-        for role in roles:
-            if role not in seen:
-                seen.add(role)
-                unique_roles.append(role)
+        return list(roles)
 
-        return unique_roles
-
-    def validate_token(self, token: str) -> KeycloakUser:
+    def validate_token(self, token: str, retain_raw: bool = False) -> KeycloakUser:
         """
         Validate a JWT access token and extract user information.
 
         Args:
             token: JWT access token string.
+            retain_raw: Keep the full decoded payload in raw_token. Such
+                validations bypass the validated-token cache.
 
         Returns:
             KeycloakUser object with user information.
@@ -272,30 +429,89 @@ class KeycloakAuth:
         if not JWT_AVAILABLE:
             raise RuntimeError("JWT library not available. Install PyJWT[crypto].")
 
+        if retain_raw:
+            return self._verify_token(token, retain_raw=True)
+
+        # Serve repeated requests with the same token without re-verifying it
+        cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+        now = time.time()
+        with self._claims_cache_lock:
+            entry = self._claims_cache.get(cache_key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._claims_cache.move_to_end(cache_key)
+                    return entry[0]
+                del self._claims_cache[cache_key]
+
+            rejected = self._rejected_cache.get(cache_key)
+            if rejected is not None:
+                if rejected[1] > now:
+                    raise ValueError(f"{rejected[0]} (cached)")
+                del self._rejected_cache[cache_key]
+
+        try:
+            user = self._verify_token(token)
+        except ValueError as e:
+            # Only remember tokens that are invalid themselves, not JWKS/network failures
+            if isinstance(e.__cause__, jwt.InvalidTokenError):
+                with self._claims_cache_lock:
+                    self._rejected_cache[cache_key] = (str(e), now + NEGATIVE_CACHE_TTL)
+                    while len(self._rejected_cache) > NEGATIVE_CACHE_MAX_ENTRIES:
+                        self._rejected_cache.popitem(last=False)
+            raise
+
+        # Successful validations are cached until the token expires
+        if user.token_exp is not None:
+            with self._claims_cache_lock:
+                self._claims_cache[cache_key] = (user, user.token_exp)
+                while len(self._claims_cache) > CLAIMS_CACHE_MAX_ENTRIES:
+                    self._claims_cache.popitem(last=False)
+
+        return user
+
+    def _verify_token(self, token: str, retain_raw: bool = False) -> KeycloakUser:
+        """
+        Verify a JWT access token against the realm's JWKS (uncached).
+
+        Args:
+            token: JWT access token string.
+            retain_raw: Keep the full decoded payload in raw_token.
+
+        Returns:
+            KeycloakUser object with user information.
+
+        Raises:
+            ValueError: If token is invalid, expired, or verification fails.
+        """
         try:
+            # Reject expired tokens before paying for signature verification.
+            # Nothing else from the unverified payload is trusted.
+            unverified_exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+            if isinstance(unverified_exp, (int, float)) and unverified_exp < time.time():
+                raise jwt.ExpiredSignatureError("Signature has expired")
+
             # Get the signing key from JWKS
-            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+            signing_key = self._get_signing_key(token)
 
             # Decode and validate the token
             payload = jwt.decode(
                 token,
-                signing_key.key,
-                algorithms=["RS256"],
-                audience="account",
+                signing_key,
+                algorithms=self.allowed_algorithms,
                 issuer=self.issuer,
                 options={
+                    "verify_signature": True,
                     "verify_exp": True,
                     "verify_iat": True,
+                    "verify_iss": True,
                     "verify_aud": False,
-                    "require": ["exp", "iat"],
+                    "require": ["exp", "iat", "iss"],
                 },
             )
 
-            # Extract expiration time
+            # Extract expiration time (raw epoch seconds; datetime via token_exp_dt)
             exp_timestamp = payload.get("exp")
-            token_exp = None
-            if exp_timestamp:
-                token_exp = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
+            token_exp = float(exp_timestamp) if exp_timestamp else None
 
             # Build user object
             user_id = payload.get("sub") or payload.get("sid") or payload.get("azp") or ""
@@ -311,13 +527,15 @@ class KeycloakAuth:
                 family_name=payload.get("family_name", ""),
                 roles=self._extract_roles(payload),
                 token_exp=token_exp,
-                raw_token=payload,
+                raw_token=payload if retain_raw else {
+                    key: payload[key] for key in RAW_TOKEN_CLAIMS if key in payload
+                },
             )
 
-        except jwt.ExpiredSignatureError:
-            raise ValueError("Token has expired")
+        except jwt.ExpiredSignatureError as e:
+            raise ValueError("Token has expired") from e
         except jwt.InvalidTokenError as e:
-            raise ValueError(f"Invalid token: {e}")
+            raise ValueError(f"Invalid token: {e}") from e
         except Exception as e:
             raise ValueError(f"Token validation failed: {e}")
 
@@ -335,22 +553,24 @@ def get_keycloak_auth() -> Optional[KeycloakAuth]:
     """
     global _keycloak_auth
 
-    if not get_keycloak_enabled():
+    if _keycloak_auth is not None:
+        return _keycloak_auth
+
+    if not _KC_ENABLED:
         return None
 
     if not JWT_AVAILABLE:
-        print("[KEYCLOAK] Warning: PyJWT not available, Keycloak auth disabled")
+        logger.warning("[KEYCLOAK] PyJWT not available, Keycloak auth disabled")
         return None
 
-    if _keycloak_auth is None:
-        _keycloak_auth = KeycloakAuth(
-            keycloak_url=get_keycloak_url(),
-            realm=get_keycloak_realm(),
-            client_id=get_keycloak_client_id(),
-            client_secret=get_keycloak_client_secret(),
-            internal_url=get_keycloak_internal_url(),
-        )
-
+    _keycloak_auth = KeycloakAuth(
+        keycloak_url=get_keycloak_url(),
+        realm=get_keycloak_realm(),
+        client_id=get_keycloak_client_id(),
+        client_secret=get_keycloak_client_secret(),
+        internal_url=get_keycloak_internal_url(),
+        allowed_algorithms=get_keycloak_allowed_algorithms(),
+    )
     return _keycloak_auth
 
 
@@ -369,10 +589,14 @@ def validate_bearer_token(auth_header: str) -> Optional[KeycloakUser]:
     Returns:
         KeycloakUser if valid, None otherwise.
     """
-    if not auth_header or not auth_header.startswith("Bearer "):
+    if not _KC_ENABLED or auth_header is None:
+        return None
+
+    # Split "Bearer <token>" in one pass
+    scheme, _, token = auth_header.partition(" ")
+    if scheme != "Bearer" or not token:
         return None
 
-    token = auth_header[7:]  # Remove "Bearer " prefix
     keycloak = get_keycloak_auth()
 
     if keycloak is None:
@@ -381,5 +605,5 @@ def validate_bearer_token(auth_header: str) -> Optional[KeycloakUser]:
     try:
         return keycloak.validate_token(token)
     except Exception as e:
-        print(f"[KEYCLOAK] Token validation failed: {e}")
+        logger.warning("[KEYCLOAK] Token validation failed: %s", e)
         return None
@@ -6,6 +6,8 @@ import time
 import os
 # To create enumerations.
 from enum import Enum
+# To cache parsed message frequencies.
+from functools import lru_cache
 
 ## Own classes.
 from serverReport import ServerReport
@@ -20,9 +22,6 @@ class MessagingPlatform(Enum):
     EMAIL = "Email"
     TELEGRAM = "Telegram"
 
-# Load config from environment/watchdog.env.
-_config = get_config()
-
 # Path to serverInfo and last sent files.
 _env_state_dir = os.getenv("WATCHDOG_STATE_DIR")
 _project_root = os.path.join(os.path.dirname(__file__), "..", "..")
@@ -38,16 +37,34 @@ lastSentInfoFile = os.path.join(state_dir, "lastSentInfoReport.txt")
 lastSentWarningFile = os.path.join(state_dir, "lastSentWarningReport.txt")
 lastSentErrorFile = os.path.join(state_dir, "lastSentErrorReport.txt")
 
+# Last-sent timestamps already read or written by this process, by file path.
+_lastSentCache = {}
+
+# Last-sent timestamps not yet written to their state files, by file path.
+_pendingStateWrites = {}
+
+# Server states that trigger a warning report.
+_WARNING_OR_ERROR_STATES = frozenset((MostCrucialServerState.WARNING, MostCrucialServerState.ERROR))
+
+
 # Message frequency from config.
-maxInfoReportFrequencySeconds = timeStringUtils.convert_time_string_to_seconds(
-    _config.get_message_frequency('info')
-)
-maxWarningReportFrequencySeconds = timeStringUtils.convert_time_string_to_seconds(
-    _config.get_message_frequency('warning')
-)
-maxErrorReportFrequencySeconds = timeStringUtils.convert_time_string_to_seconds(
-    _config.get_message_frequency('error')
-)
+@lru_cache(maxsize=8)
+def getMaxReportFrequencySeconds(messageType: str) -> int:
+
+    """Get the minimum interval between two reports of a type in seconds.
+
+    The parsed value is cached; call getMaxReportFrequencySeconds.cache_clear()
+    after reloading the config to pick up new frequencies.
+
+    Args:
+        messageType (str): 'info', 'warning' or 'error'.
+
+    Returns:
+        int: Frequency in seconds.
+    """
+    return timeStringUtils.convert_time_string_to_seconds(
+        get_config().get_message_frequency(messageType)
+    )
 
 
 # Send server report based on state and last sent report date.
@@ -65,37 +82,49 @@ def sendServerReport(serverReport: ServerReport, messagePlatform: MessagingPlatf
         None: This function has no return value.
     """
 
-    if shouldInfoReportBeSent():
-        sendInfoReport(serverReport.getServerReportMessage())
-    
-    if shouldWarningReportBeSent(serverReport.getMostCrucialState()):
-        sendWarningReport(serverReport.getServerReportMessage())
-    
-    if shouldErrorReportBeSent(serverReport.getMostCrucialState()):
-        sendErrorReport(serverReport.getServerReportMessage())
+    # Evaluate all frequency limits against the same point in time.
+    nowUnixTimestamp = int(time.time())
+
+    try:
+        if shouldInfoReportBeSent(nowUnixTimestamp):
+            sendInfoReport(serverReport.getServerReportMessage())
+
+        if shouldWarningReportBeSent(serverReport.getMostCrucialState(), nowUnixTimestamp):
+            sendWarningReport(serverReport.getServerReportMessage())
+
+        if shouldErrorReportBeSent(serverReport.getMostCrucialState(), nowUnixTimestamp):
+            sendErrorReport(serverReport.getServerReportMessage())
+    finally:
+        # Persist the timestamps of all reports sent in this pass in one go.
+        flushLastSentStateFiles()
     
 
 
 # Should the info report be sent.
-def shouldInfoReportBeSent():
+def shouldInfoReportBeSent(nowUnixTimestamp: int = None):
 
     """Check whether the next info report should be sent.
 
+    Args:
+        nowUnixTimestamp (int, optional): Current unix timestamp. Defaults to
+            int(time.time()).
+
     Returns:
         bool: True if enough time elapsed since the last sent info report.
     """
 
-    lastSentInfoUnixTimestamp = getLastSentUnixTimestamp(lastSentInfoFile)
-    if lastSentInfoUnixTimestamp + maxInfoReportFrequencySeconds < int(time.time()):
-        return True
-    else:
-        return False
+    if nowUnixTimestamp is None:
+        nowUnixTimestamp = int(time.time())
+
+    return getLastSentUnixTimestamp(lastSentInfoFile) + getMaxReportFrequencySeconds('info') < nowUnixTimestamp
 
 
 # Send info report and write last sent state to file.
 def sendInfoReport(reportMessage):
 
-    """Send an info report and persist its last-sent timestamp.
+    """Send an info report and record its last-sent timestamp.
+
+    The timestamp is written to the state file by flushLastSentStateFiles().
 
     Args:
         reportMessage (str): Message body.
@@ -107,37 +136,41 @@ def sendInfoReport(reportMessage):
     # Send Info Report Message.
     telegramUtils.sendInfoMessage(reportMessage)
 
-    # Write to file when the last Info report message has been sent.
-    fileUtils.overwriteContentOfFile(lastSentInfoFile, time.time())
+    # Remember when the last Info report message has been sent (written on flush).
+    sentUnixTimestamp = time.time()
+    _pendingStateWrites[lastSentInfoFile] = sentUnixTimestamp
+    _lastSentCache[lastSentInfoFile] = int(sentUnixTimestamp)
 
 
     
 # Should the warning report be sent.
-def shouldWarningReportBeSent(mostCrucialServerState: MostCrucialServerState):
+def shouldWarningReportBeSent(mostCrucialServerState: MostCrucialServerState, nowUnixTimestamp: int = None):
     """Check whether the next warning report should be sent.
 
     Args:
         mostCrucialServerState (MostCrucialServerState): Current server state.
+        nowUnixTimestamp (int, optional): Current unix timestamp. Defaults to
+            int(time.time()).
 
     Returns:
         bool: True if state is at least WARNING and frequency allows sending.
     """
 
     # Is most crucial server state at least warning?
-    if mostCrucialServerState == MostCrucialServerState.WARNING or mostCrucialServerState == MostCrucialServerState.ERROR:
-        # Are frequency limits reached.
-        lastSentWarningUnixTimestamp = getLastSentUnixTimestamp(lastSentWarningFile)
-        if lastSentWarningUnixTimestamp + maxWarningReportFrequencySeconds < int(time.time()):
-            return True
-        else:
-            return False
-    else:
+    if mostCrucialServerState not in _WARNING_OR_ERROR_STATES:
         return False
 
+    # Are frequency limits reached.
+    if nowUnixTimestamp is None:
+        nowUnixTimestamp = int(time.time())
+    return getLastSentUnixTimestamp(lastSentWarningFile) + getMaxReportFrequencySeconds('warning') < nowUnixTimestamp
+
 # Send warning report and write last sent state to file.
 def sendWarningReport(reportMessage):
 
-    """Send a warning report and persist its last-sent timestamp.
+    """Send a warning report and record its last-sent timestamp.
+
+    The timestamp is written to the state file by flushLastSentStateFiles().
 
     Args:
         reportMessage (str): Message body.
@@ -149,37 +182,41 @@ def sendWarningReport(reportMessage):
     # Send Warning Report Message.
     telegramUtils.sendWarningMessage(reportMessage)
 
-    # Write to file when the last Warning report message has been sent.
-    fileUtils.overwriteContentOfFile(lastSentWarningFile, time.time())
+    # Remember when the last Warning report message has been sent (written on flush).
+    sentUnixTimestamp = time.time()
+    _pendingStateWrites[lastSentWarningFile] = sentUnixTimestamp
+    _lastSentCache[lastSentWarningFile] = int(sentUnixTimestamp)
 
 
     
 # Should the error report be sent.
-def shouldErrorReportBeSent(mostCrucialServerState: MostCrucialServerState):
+def shouldErrorReportBeSent(mostCrucialServerState: MostCrucialServerState, nowUnixTimestamp: int = None):
     """Check whether the next error report should be sent.
 
     Args:
         mostCrucialServerState (MostCrucialServerState): Current server state.
+        nowUnixTimestamp (int, optional): Current unix timestamp. Defaults to
+            int(time.time()).
 
     Returns:
         bool: True if state is ERROR and frequency allows sending.
     """
 
     # Is most crucial server state Error?
-    if mostCrucialServerState == MostCrucialServerState.ERROR:
-        # Are frequency limits reached.
-        lastSentErrorUnixTimestamp = getLastSentUnixTimestamp(lastSentErrorFile)
-        if lastSentErrorUnixTimestamp + maxErrorReportFrequencySeconds < int(time.time()):
-            return True
-        else:
-            return False
-    else:
+    if mostCrucialServerState != MostCrucialServerState.ERROR:
         return False
+
+    # Are frequency limits reached.
+    if nowUnixTimestamp is None:
+        nowUnixTimestamp = int(time.time())
+    return getLastSentUnixTimestamp(lastSentErrorFile) + getMaxReportFrequencySeconds('error') < nowUnixTimestamp
     
 # Send error report and write last sent state to file.
 def sendErrorReport(reportMessage):
 
-    """Send an error report and persist its last-sent timestamp.
+    """Send an error report and record its last-sent timestamp.
+
+    The timestamp is written to the state file by flushLastSentStateFiles().
 
     Args:
         reportMessage (str): Message body.
@@ -191,8 +228,23 @@ def sendErrorReport(reportMessage):
     # Send Error Report Message.
     telegramUtils.sendErrorMessage(reportMessage)
 
-    # Write to file when the last error report message has been sent.
-    fileUtils.overwriteContentOfFile(lastSentErrorFile, time.time())
+    # Remember when the last error report message has been sent (written on flush).
+    sentUnixTimestamp = time.time()
+    _pendingStateWrites[lastSentErrorFile] = sentUnixTimestamp
+    _lastSentCache[lastSentErrorFile] = int(sentUnixTimestamp)
+
+
+# Write pending last sent states to their files.
+def flushLastSentStateFiles():
+
+    """Write all pending last-sent timestamps to their state files.
+
+    Returns:
+        None: This function has no return value.
+    """
+    while _pendingStateWrites:
+        stateFile, sentUnixTimestamp = _pendingStateWrites.popitem()
+        fileUtils.overwriteContentOfFile(stateFile, sentUnixTimestamp)
 
 
 # Get last sent time.
@@ -200,16 +252,25 @@ def getLastSentUnixTimestamp(fileToGetTimeStampOf) -> int:
 
     """Read last-sent timestamp from a file.
 
+    The value is cached per path and kept up to date by the send*Report
+    functions, so each file is read at most once per process.
+
     Args:
         fileToGetTimeStampOf (str): Path to the timestamp file.
 
     Returns:
         int: Unix timestamp, or 0 if file does not exist or cannot be parsed.
     """
+    cachedUnixTimestamp = _lastSentCache.get(fileToGetTimeStampOf)
+    if cachedUnixTimestamp is not None:
+        return cachedUnixTimestamp
+
     try:
         content = fileUtils.readStringFromFile(fileToGetTimeStampOf)
         float_value = float(content)
-        return int(float_value)
+        lastSentUnixTimestamp = int(float_value)
     except Exception as e:
         print(f"getLastSentUnixTimestamp File does not exist or could not be converted to valid unixtimestamp, returning 0: {e}")
-        return 0
+        lastSentUnixTimestamp = 0
+    _lastSentCache[fileToGetTimeStampOf] = lastSentUnixTimestamp
+    return lastSentUnixTimestamp
@@ -10,6 +10,15 @@ import sys
 import json
 # To create enumerations.
 from enum import Enum
+# Comparison operators for threshold checks.
+import operator
+
+# Fast JSON parsing (optional, falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 ## Own classes.
 from serverReport import ServerReport
@@ -27,6 +36,61 @@ class ThresholdStatus(Enum):
     WARNING = "WARNING"
     ERROR = "ERROR"
 
+
+# serverInfo/system_info.json, resolved once at import.
+_SERVER_INFO_PATH = os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", "serverInfo")), "system_info.json")
+
+# Gluster-not-installed handling: upper-cased config value -> (message suffix, state).
+_GLUSTER_NOT_INSTALLED_HANDLING = {
+    "WARNING": ("", ThresholdStatus.WARNING),
+    "ERROR": ("", ThresholdStatus.ERROR),
+    "NONE": ("", ThresholdStatus.OK),
+}
+_GLUSTER_HANDLING_HINT = "Please specify 'warning', 'error', or 'none' for gluster_not_installed_handling."
+
+# Per-volume gluster item lists, in report order.
+_GLUSTER_VOLUME_SECTIONS = (
+    ("Unhealthy Bricks", "all_unhealthy_bricks"),
+    ("Unhealthy Processes", "all_unhealthy_processes"),
+    ("Errors/Warnings", "all_errors_warnings"),
+    ("Active Tasks", "all_active_tasks"),
+)
+
+
+# Icons to emphasize warning or error state.
+_ICON_BY_STATUS = {
+    ThresholdStatus.OK: "",
+    ThresholdStatus.WARNING: "⚠️",
+    ThresholdStatus.ERROR: "🚨",
+}
+
+
+# Threshold status indexed by error_hit * 2 + warning_hit; an error hit wins.
+_STATUS_BY_HITS = (ThresholdStatus.OK, ThresholdStatus.WARNING, ThresholdStatus.ERROR, ThresholdStatus.ERROR)
+
+
+def _threshold_status(value, thresholds: Thresholds, compare=operator.gt, nonzero_guard: bool = False, integer: bool = False) -> ThresholdStatus:
+    """Compare a metric value against its error and warning thresholds.
+
+    Args:
+        value: Numeric metric value.
+        thresholds (Thresholds): Thresholds for the metric.
+        compare: Comparison applied as compare(value, threshold); defaults to ">".
+        nonzero_guard (bool): Treat a threshold of 0 as disabled.
+        integer (bool): Truncate the thresholds to int before comparing.
+
+    Returns:
+        ThresholdStatus: ERROR, WARNING or OK.
+    """
+    error = thresholds.error_float
+    warning = thresholds.warning_float
+    if integer:
+        error = int(error)
+        warning = int(warning)
+    is_error = compare(value, error) and not (nonzero_guard and error == 0)
+    is_warning = compare(value, warning) and not (nonzero_guard and warning == 0)
+    return _STATUS_BY_HITS[is_error * 2 + is_warning]
+
     
 class ServerReportUtils:
     def __init__(self):
@@ -41,151 +105,180 @@ class ServerReportUtils:
         self.gluster_not_installed_handling = self._config.gluster_not_installed_handling
         if not self.gluster_not_installed_handling:
             self.gluster_not_installed_handling = "not specified"
+        if self.gluster_not_installed_handling == "not specified":
+            self._gluster_handling = ("Unspecified config value. " + _GLUSTER_HANDLING_HINT, ThresholdStatus.ERROR)
+        else:
+            self._gluster_handling = _GLUSTER_NOT_INSTALLED_HANDLING.get(
+                self.gluster_not_installed_handling.upper(),
+                ("Invalid config value. " + _GLUSTER_HANDLING_HINT, ThresholdStatus.ERROR),
+            )
+
+        
+        # Server info file (numeric fields are parsed once per load).
+        self._info_path = _SERVER_INFO_PATH
+        self._info_mtime = None
+        self._report_cache = {}
+        self._refresh_info()
+
+        # Thresholds per key, built once instead of on every lookup.
+        self._thresholds_cache = {key: self._config.get_thresholds(key) for key in self._config.threshold_keys}
+
+        # system_restart thresholds are time strings (e.g. "7d"); convert them to seconds once.
+        restart_thresholds = self._thresholds_cache.get('system_restart')
+        self._restart_thresholds_seconds = None if restart_thresholds is None else Thresholds(
+            warning=str(timeStringUtils.convert_time_string_to_seconds(restart_thresholds.warning)),
+            error=str(timeStringUtils.convert_time_string_to_seconds(restart_thresholds.error)),
+        )
 
         
-        # Server info file.
+
+    def _refresh_info(self) -> None:
+        """Load serverInfo/system_info.json, skipping the read if its mtime is unchanged."""
         try:
-            server_info_file_path_and_name = os.path.join(os.path.dirname(__file__), "..", "..", "serverInfo/", "system_info.json")
-            with open(server_info_file_path_and_name) as server_info_file:
-                self.server_info_array = json.load(server_info_file)
+            mtime = os.stat(self._info_path).st_mtime_ns
+            if mtime == self._info_mtime:
+                return
+            with open(self._info_path, "rb") as server_info_file:
+                server_info_array = _json_loads(server_info_file.read())
         except Exception as e:
             errorMessage = "There has been an error creating a report for " + self.server_name + ":\n"
             errorMessage += f"\nCould not read serverInfo/system_info.json: {e} \nDid you map the serverInfo directory correctly? \nHas the report been created on the server? \n"
             raise Exception(errorMessage)
 
-        
+        self._parsed = self._parse_numeric_fields(server_info_array)
+        self.server_info_array = server_info_array
+        self._info_mtime = mtime
+        self._report_cache.clear()
+
 
     # Create a simple consize text message from the server state json and server state.
     def getServerReport(self, messagePlatform: MessagingPlatform = MessagingPlatform.DEFAULT) -> ServerReport:
+        """Build the server report from serverInfo/system_info.json.
+
+        Args:
+            messagePlatform (MessagingPlatform, optional): Currently unused;
+                all platforms share the same rendering, so the value is never
+                compared. Defaults to MessagingPlatform.DEFAULT.
+
+        Returns:
+            ServerReport: Report message with warning/error classification.
+        """
+
+        # Pick up a rewritten system_info.json (this also drops cached reports).
+        self._refresh_info()
+
+        # Apart from the timestamp age, the report only depends on the loaded
+        # file, so repeated calls reuse the rendered report.
+        timestamp_status = self._timestamp_status()
+        cache_key = (messagePlatform, timestamp_status)
+        report = self._report_cache.get(cache_key)
+        if report is None:
+            report = self._report_cache[cache_key] = self._build_report(timestamp_status)
+        return report
+
+
+    def _timestamp_status(self) -> ThresholdStatus:
+        """Classify the age of the loaded system_info.json against its thresholds."""
+        current_timestamp = int(time.time())
+        system_info_timestamp = self._parsed['timestamp']
+        thresholds = self.get_thresholds('timestampAgeMinutes')
+        if current_timestamp > system_info_timestamp + thresholds.error_float * 60:
+            return ThresholdStatus.ERROR
+        if current_timestamp > system_info_timestamp + thresholds.warning_float * 60:
+            return ThresholdStatus.WARNING
+        return ThresholdStatus.OK
+
 
-        # Save, if there have been warnings or errors.
-        hasWarning=False
-        hasError=False
+    def _build_report(self, timestamp_status: ThresholdStatus) -> ServerReport:
+        """Render the report for the loaded system_info.json."""
+
+        # Section dicts are bound to locals once per section.
+        info = self.server_info_array
+
+        # Statuses of all checks; warnings and errors are derived from them at the end.
+        statuses = []
 
         # Icons to emphasize warning or error state.
-        errorIcon="🚨"
-        warningIcon="⚠️"
-        
-        # Helper function to format text as code.
-        def wrap_with_code(text):
-            return f"<code>{text}</code>"
-        
-        # Helper function to format text as bold.
-        def italicUnderline(text):
-            return f"<u><i>{text}</i></u>"
-        
-        # Determine, if array is empty (or only contains one empty string).
-        def isArrayEmpty(array):
-            if array:
-                if len(array) == 1:
-                    if array[0]:
-                        return False
-                    else:
-                        return True
-                else:
-                    return False
-            else:
-                return True
+        errorIcon = _ICON_BY_STATUS[ThresholdStatus.ERROR]
+        warningIcon = _ICON_BY_STATUS[ThresholdStatus.WARNING]
 
-        # Initialize the serverReport.
-        serverReport = ""
+        # Collect the report fragments and join them once at the end.
+        parts = []
 
         # Hostname.
-        serverReport += f"<b>Hostname:</b> {wrap_with_code(self.server_info_array['system_info']['hostname'])}\n"
+        parts.append(f"<b>Hostname:</b> <code>{info['system_info']['hostname']}</code>\n")
 
         # Timestamp.
-        current_timestamp = int(time.time())
-        system_info_timestamp = self.server_info_array['timestamp']['unix_format']
-        thresholds = self.get_thresholds('timestampAgeMinutes')
-        stateIndicatingIcon = ""
-        if int(current_timestamp) > int(system_info_timestamp) + float(thresholds.error) * 60:
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif int(current_timestamp) > int(system_info_timestamp) + float(thresholds.warning) * 60:
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        serverReport += stateIndicatingIcon + f"<b>Timestamp:</b> {wrap_with_code(self.server_info_array['timestamp']['human_readable_format'])}\n"
+        status = timestamp_status
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        parts.append(f"{stateIndicatingIcon}<b>Timestamp:</b> <code>{info['timestamp']['human_readable_format']}</code>\n")
 
         # Add Last 15min CPU Percentage.
         thresholds = self.get_thresholds('cpu')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['cpu']['last_15min_cpu_percentage'].strip().strip("%"))
-        if system_value > float(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > float(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        cpu_percentage_string=self.server_info_array['cpu']['last_15min_cpu_percentage'] + "%"
-        serverReport += stateIndicatingIcon + f"<b>CPU:</b> {wrap_with_code(cpu_percentage_string)}\n"
+        system_value = self._parsed['cpu_pct']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        cpu_info = info['cpu']
+        cpu_percentage_string=cpu_info['last_15min_cpu_percentage'] + "%"
+        parts.append(f"{stateIndicatingIcon}<b>CPU:</b> <code>{cpu_percentage_string}</code>\n")
 
         # Add Disk Usage information.
         thresholds = self.get_thresholds('disk')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['disk']['disk_usage_percentage'].strip().strip("%"))
-        if system_value > float(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > float(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        disk_usage_info = f"{self.server_info_array['disk']['disk_usage_percentage']} " \
-                        f"({self.server_info_array['disk']['disk_usage_amount']} / {self.server_info_array['disk']['total_disk_avail']})"
-        serverReport += stateIndicatingIcon + f"<b>Disk:</b> {wrap_with_code(disk_usage_info)}\n"
+        system_value = self._parsed['disk_pct']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        disk_info = info['disk']
+        disk_usage_info = f"{disk_info['disk_usage_percentage']} " \
+                        f"({disk_info['disk_usage_amount']} / {disk_info['total_disk_avail']})"
+        parts.append(f"{stateIndicatingIcon}<b>Disk:</b> <code>{disk_usage_info}</code>\n")
 
         # Add Memory Usage information.
         thresholds = self.get_thresholds('memory')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['memory']['memory_usage_percentage'].strip().strip("%"))
-        if system_value > float(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > float(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        memory_usage_info = f"{self.server_info_array['memory']['memory_usage_percentage']}% " \
-                            f"({self.server_info_array['memory']['used_memory_human']} / {self.server_info_array['memory']['total_memory_human']})"
-        serverReport += stateIndicatingIcon + f"<b>Memory:</b> {wrap_with_code(memory_usage_info)}\n"
+        system_value = self._parsed['memory_pct']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        memory_info = info['memory']
+        memory_usage_info = f"{memory_info['memory_usage_percentage']}% " \
+                            f"({memory_info['used_memory_human']} / {memory_info['total_memory_human']})"
+        parts.append(f"{stateIndicatingIcon}<b>Memory:</b> <code>{memory_usage_info}</code>\n")
 
         # Add Swap Status information.
+        swap_info = info['swap']
         stateIndicatingIcon = ""
-        if self.server_info_array['swap']['swap_status'] != "Off":
-            hasWarning = True
+        if swap_info['swap_status'] != "Off":
+            statuses.append(ThresholdStatus.WARNING)
             stateIndicatingIcon = warningIcon
-        serverReport += stateIndicatingIcon + f"<b>Swap Status:</b> {wrap_with_code(self.server_info_array['swap']['swap_status'])}\n"
+        parts.append(f"{stateIndicatingIcon}<b>Swap Status:</b> <code>{swap_info['swap_status']}</code>\n")
         
         # Add Processes.
         thresholds = self.get_thresholds('processes')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['processes']['amount_processes'])
-        if system_value > float(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > float(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        serverReport += stateIndicatingIcon + f"<b>Processes:</b> {wrap_with_code(self.server_info_array['processes']['amount_processes'])}\n"
+        system_value = self._parsed['processes']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        parts.append(f"{stateIndicatingIcon}<b>Processes:</b> <code>{info['processes']['amount_processes']}</code>\n")
         
         # Users information.
         thresholds = self.get_thresholds('users')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['users']['logged_in_users'])
-        if system_value > float(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > float(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        serverReport += stateIndicatingIcon + f"<b>Logged In Users:</b> {wrap_with_code(self.server_info_array['users']['logged_in_users'])}\n"
+        system_value = self._parsed['users']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        parts.append(f"{stateIndicatingIcon}<b>Logged In Users:</b> <code>{info['users']['logged_in_users']}</code>\n")
 
         # Network info in server info?
-        if 'network' in self.server_info_array:
+        if 'network' in info:
+            network_info = info['network']
 
             # Vnstab Enabled?
-            if self.server_info_array['network']['is_vnstab_installed'].upper() == "TRUE":
+            if network_info['is_vnstab_installed'].upper() == "TRUE":
 
                 # Enough network data?
-                if self.server_info_array['network']['has_vnstab_enough_data'].upper() == "TRUE":
+                if network_info['has_vnstab_enough_data'].upper() == "TRUE":
 
                     # Thresholds in config?
                     thresholds_available = True
@@ -202,138 +295,99 @@ class ServerReportUtils:
 
                         # Network up.
                         thresholds = thresholds_up
-                        stateIndicatingIcon = ""
-                        system_value = float(self.server_info_array['network']['upstream_avg_bits'].strip())
-                        if system_value > float(thresholds.error) and float(thresholds.error) != 0:
-                            hasError = True
-                            stateIndicatingIcon = errorIcon
-                        elif system_value > float(thresholds.warning) and float(thresholds.warning) != 0:
-                            hasWarning = True
-                            stateIndicatingIcon = warningIcon
-                        network_up_info = f"{self.server_info_array['network']['upstream_avg_human']}"
-                        serverReport += stateIndicatingIcon + f"<b>Network Upstream:</b> {wrap_with_code(network_up_info)}\n"
+                        system_value = self._parsed['network_up']
+                        status = _threshold_status(system_value, thresholds, nonzero_guard=True)
+                        statuses.append(status)
+                        stateIndicatingIcon = _ICON_BY_STATUS[status]
+                        network_up_info = f"{network_info['upstream_avg_human']}"
+                        parts.append(f"{stateIndicatingIcon}<b>Network Upstream:</b> <code>{network_up_info}</code>\n")
 
                         # Network down.
                         thresholds = thresholds_down
-                        stateIndicatingIcon = ""
-                        system_value = float(self.server_info_array['network']['downstream_avg_bits'].strip())
-                        if system_value > float(thresholds.error) and float(thresholds.error) != 0:
-                            hasError = True
-                            stateIndicatingIcon = errorIcon
-                        elif system_value > float(thresholds.warning) and float(thresholds.warning) != 0:
-                            hasWarning = True
-                            stateIndicatingIcon = warningIcon
-                        network_up_info = f"{self.server_info_array['network']['downstream_avg_human']}"
-                        serverReport += stateIndicatingIcon + f"<b>Network Downstream:</b> {wrap_with_code(network_up_info)}\n"
+                        system_value = self._parsed['network_down']
+                        status = _threshold_status(system_value, thresholds, nonzero_guard=True)
+                        statuses.append(status)
+                        stateIndicatingIcon = _ICON_BY_STATUS[status]
+                        network_up_info = f"{network_info['downstream_avg_human']}"
+                        parts.append(f"{stateIndicatingIcon}<b>Network Downstream:</b> <code>{network_up_info}</code>\n")
 
                         # Network total.
                         thresholds = thresholds_total
-                        stateIndicatingIcon = ""
-                        system_value = float(self.server_info_array['network']['total_network_avg_bits'].strip())
-                        if system_value > float(thresholds.error) and float(thresholds.error) != 0:
-                            hasError = True
-                            stateIndicatingIcon = errorIcon
-                        elif system_value > float(thresholds.warning) and float(thresholds.warning) != 0:
-                            hasWarning = True
-                            stateIndicatingIcon = warningIcon
-                        network_up_info = f"{self.server_info_array['network']['total_network_avg_human']}"
-                        serverReport += stateIndicatingIcon + f"<b>Network Total:</b> {wrap_with_code(network_up_info)}\n"
+                        system_value = self._parsed['network_total']
+                        status = _threshold_status(system_value, thresholds, nonzero_guard=True)
+                        statuses.append(status)
+                        stateIndicatingIcon = _ICON_BY_STATUS[status]
+                        network_up_info = f"{network_info['total_network_avg_human']}"
+                        parts.append(f"{stateIndicatingIcon}<b>Network Total:</b> <code>{network_up_info}</code>\n")
 
                     else:
                         # No Thresholds in config.
-                        hasError = True
+                        statuses.append(ThresholdStatus.ERROR)
                         stateIndicatingIcon = errorIcon
                         network_error_msg = f"No network thresholds in config"
-                        serverReport += stateIndicatingIcon + f"<b>Network:</b> {wrap_with_code(network_error_msg)}\n"
+                        parts.append(f"{stateIndicatingIcon}<b>Network:</b> <code>{network_error_msg}</code>\n")
                 else:
                     # Not Enough vnstab data yet.
-                    hasWarning = True
+                    statuses.append(ThresholdStatus.WARNING)
                     stateIndicatingIcon = warningIcon
                     network_error_msg = f"Vnstab does not have enough data yet"
-                    serverReport += stateIndicatingIcon + f"<b>Network:</b> {wrap_with_code(network_error_msg)}\n"
+                    parts.append(f"{stateIndicatingIcon}<b>Network:</b> <code>{network_error_msg}</code>\n")
             else:
                 # Vnstab is not enabled.
-                hasError = True
+                statuses.append(ThresholdStatus.ERROR)
                 stateIndicatingIcon = errorIcon
                 network_error_msg = f"Vnstab is not enabled"
-                serverReport += stateIndicatingIcon + f"<b>Network:</b> {wrap_with_code(network_error_msg)}\n" 
+                parts.append(f"{stateIndicatingIcon}<b>Network:</b> <code>{network_error_msg}</code>\n")
         else:
             # No Network info in server info.
-            hasError = True
+            statuses.append(ThresholdStatus.ERROR)
             stateIndicatingIcon = errorIcon
             network_error_msg = f"No network info in server info array"
-            serverReport += stateIndicatingIcon + f"<b>Network:</b> {wrap_with_code(network_error_msg)}\n"
+            parts.append(f"{stateIndicatingIcon}<b>Network:</b> <code>{network_error_msg}</code>\n")
 
         
         # Gluster info in server_info_array?
-        if 'gluster' in self.server_info_array:
+        if 'gluster' in info:
+            gluster_info = info['gluster']
 
             # Gluster installed?
-            if self.server_info_array['gluster']['is_gluster_installed'].upper() == "TRUE":
+            if gluster_info['is_gluster_installed'].upper() == "TRUE":
 
                 # Any unhealthy peers?
-                number_of_peers = int(self.server_info_array['gluster']['number_of_peers'])
-                number_of_healthy_peers = int(self.server_info_array['gluster']['number_of_healthy_peers'])
+                number_of_peers = self._parsed['gluster_peers']
+                number_of_healthy_peers = self._parsed['gluster_healthy_peers']
                 number_of_unhealthy_peers = number_of_peers - number_of_healthy_peers
 
                 # Gluster peers Message.
-                gluster_peers_msg = wrap_with_code(f"Gluster Peers (Healthy: {number_of_healthy_peers} / Total: {number_of_peers})\n")
+                gluster_peers_parts = [f"<code>Gluster Peers (Healthy: {number_of_healthy_peers} / Total: {number_of_peers})\n</code>"]
 
                 # Add peers output, if there are any unhealthy peers.
                 if number_of_unhealthy_peers != 0:
-                    for peer in self.server_info_array['gluster']['gluster_peers']:
-                        gluster_peers_msg += wrap_with_code(peer) + "\n"
+                    for peer in gluster_info['gluster_peers']:
+                        gluster_peers_parts.append(f"<code>{peer}</code>\n")
 
 
                 # Any unhealthy volumes?
-                number_of_volumes = int(self.server_info_array['gluster']['number_of_volumes'])
-                number_of_healthy_volumes = int(self.server_info_array['gluster']['number_of_healthy_volumes'])
+                number_of_volumes = self._parsed['gluster_volumes']
+                number_of_healthy_volumes = self._parsed['gluster_healthy_volumes']
                 number_of_unhealthy_volumes = number_of_volumes - number_of_healthy_volumes
 
                 # Gluster volumes Message.
-                gluster_volumes_msg = wrap_with_code(f"Gluster Volumes (Healthy: {number_of_healthy_volumes} / Total: {number_of_volumes})\n")
+                gluster_volumes_parts = [f"<code>Gluster Volumes (Healthy: {number_of_healthy_volumes} / Total: {number_of_volumes})\n</code>"]
 
                 # Add volumes output, if there are any unhealthy volumes.
                 if number_of_unhealthy_volumes != 0:
-                    for index, volume in enumerate(self.server_info_array['gluster']['gluster_volumes']):
-                        gluster_volumes_msg += italicUnderline("Volume: ") + wrap_with_code(volume) + "\n"
-
-                        # Print unhealthy bricks, if there are any.
-                        if self.server_info_array['gluster']['all_unhealthy_bricks'][index]:
-                            if not isArrayEmpty(self.server_info_array['gluster']['all_unhealthy_bricks'][index]):
-                                gluster_volumes_msg += italicUnderline("Unhealthy Bricks: ")
-                                for item in self.server_info_array['gluster']['all_unhealthy_bricks'][index]:
-                                    gluster_volumes_msg += wrap_with_code(item) + ", "
-                                # Remove the last occurrence of ", " and add a newline character.
-                                gluster_volumes_msg = gluster_volumes_msg.rstrip(", ") + "\n"
-
-                        # Print unhealthy processes, if there are any.
-                        if self.server_info_array['gluster']['all_unhealthy_processes'][index]:
-                            if not isArrayEmpty(self.server_info_array['gluster']['all_unhealthy_processes'][index]):
-                                gluster_volumes_msg += italicUnderline("Unhealthy Processes: ")
-                                for item in self.server_info_array['gluster']['all_unhealthy_processes'][index]:
-                                    gluster_volumes_msg += wrap_with_code(item) + ", "
-                                # Remove the last occurrence of ", " and add a newline character.
-                                gluster_volumes_msg = gluster_volumes_msg.rstrip(", ") + "\n"
-
-                        # Print errors/warnings, if there are any.
-                        if self.server_info_array['gluster']['all_errors_warnings'][index]:
-                            if not isArrayEmpty(self.server_info_array['gluster']['all_errors_warnings'][index]):
-                                gluster_volumes_msg += italicUnderline("Errors/Warnings: ")
-                                for item in self.server_info_array['gluster']['all_errors_warnings'][index]:
-                                    if item:
-                                        gluster_volumes_msg += wrap_with_code(item) + ", "
-                                # Remove the last occurrence of ", " and add a newline character.
-                                gluster_volumes_msg = gluster_volumes_msg.rstrip(", ") + "\n"
-
-                        # Print active tasks, if there are any.
-                        if self.server_info_array['gluster']['all_active_tasks'][index]:
-                            if not isArrayEmpty(self.server_info_array['gluster']['all_active_tasks'][index]):
-                                gluster_volumes_msg += italicUnderline("Active Tasks: ")
-                                for item in self.server_info_array['gluster']['all_active_tasks'][index]:
-                                    gluster_volumes_msg += wrap_with_code(item) + ", "
-                                # Remove the last occurrence of ", " and add a newline character.
-                                gluster_volumes_msg = gluster_volumes_msg.rstrip(", ") + "\n"
+                    section_lists = [gluster_info[key] for _, key in _GLUSTER_VOLUME_SECTIONS]
+                    for index, volume in enumerate(gluster_info['gluster_volumes']):
+                        gluster_volumes_parts.append(f"<u><i>Volume: </i></u><code>{volume}</code>\n")
+
+                        # Print unhealthy bricks, processes, errors/warnings and active tasks, if there are any.
+                        # A section list shorter than the volume list counts as empty for the missing volumes.
+                        for (label, _), section_list in zip(_GLUSTER_VOLUME_SECTIONS, section_lists):
+                            section_items = section_list[index] if index < len(section_list) else None
+                            items_list = [f"<code>{item}</code>" for item in section_items or () if item]
+                            if items_list:
+                                gluster_volumes_parts.append(f"<u><i>{label}: </i></u>{', '.join(items_list)}\n")
 
 
 
@@ -350,304 +404,251 @@ class ServerReportUtils:
 
                     # Unhealthy peers.
                     thresholds = gluster_unhealthy_peers
-                    stateIndicatingIcon = ""
                     system_value = number_of_unhealthy_peers
-                    if system_value >= float(thresholds.error) and float(thresholds.error) != 0:
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning) and float(thresholds.warning) != 0:
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
-                    serverReport += stateIndicatingIcon + f"<b>Gluster Peers:</b> {gluster_peers_msg}"
+                    status = _threshold_status(system_value, thresholds, operator.ge, nonzero_guard=True)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
+                    parts.append(f"{stateIndicatingIcon}<b>Gluster Peers:</b> {''.join(gluster_peers_parts)}")
 
                     # Unhealthy volumes.
                     thresholds = gluster_unhealthy_volumes
-                    stateIndicatingIcon = ""
                     system_value = number_of_unhealthy_volumes
-                    if system_value >= float(thresholds.error) and float(thresholds.error) != 0:
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning) and float(thresholds.warning) != 0:
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
-                    serverReport += stateIndicatingIcon + f"<b>Gluster Volumes:</b> {gluster_volumes_msg}"
+                    status = _threshold_status(system_value, thresholds, operator.ge, nonzero_guard=True)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
+                    parts.append(f"{stateIndicatingIcon}<b>Gluster Volumes:</b> {''.join(gluster_volumes_parts)}")
 
                 else:
                     # No Thresholds in config.
-                    hasError = True
+                    statuses.append(ThresholdStatus.ERROR)
                     stateIndicatingIcon = errorIcon
                     gluster_error_msg = f"No gluster thresholds in config"
-                    serverReport += stateIndicatingIcon + f"<b>Gluster:</b> {wrap_with_code(gluster_error_msg)}\n"
+                    parts.append(f"{stateIndicatingIcon}<b>Gluster:</b> <code>{gluster_error_msg}</code>\n")
 
             else:
                 # Gluster is not installed -> Determine handling.
 
-                # Prepare message and icon.
-                gluster_error_msg = "Gluster is not installed. "
-                stateIndicatingIcon = ""
-
-                # Check the config value and handle 
-                if self.gluster_not_installed_handling.upper() == "WARNING":
-                    stateIndicatingIcon = warningIcon
-                    hasWarning = True
-
-                elif self.gluster_not_installed_handling.upper() == "ERROR":
-                    stateIndicatingIcon = errorIcon
-                    hasError = True
-
-                elif self.gluster_not_installed_handling.upper() == "NONE":
-                    gluster_error_msg += ""
-
-                elif self.gluster_not_installed_handling == "not specified":
-                    gluster_error_msg += "Unspecified config value. Please specify 'warning', 'error', or 'none' for gluster_not_installed_handling."
-                    stateIndicatingIcon = errorIcon
-                    hasError = True
-
-                else:
-                    gluster_error_msg += "Invalid config value. Please specify 'warning', 'error', or 'none' for gluster_not_installed_handling."
-                    stateIndicatingIcon = errorIcon
-                    hasError = True
+                # Message suffix and state were resolved from the config in __init__.
+                gluster_handling_msg, gluster_handling_status = self._gluster_handling
+                gluster_error_msg = "Gluster is not installed. " + gluster_handling_msg
+                status = gluster_handling_status
+                statuses.append(status)
+                stateIndicatingIcon = _ICON_BY_STATUS[status]
 
-                serverReport += stateIndicatingIcon + f"<b>Gluster:</b> {wrap_with_code(gluster_error_msg)}\n" 
+                parts.append(f"{stateIndicatingIcon}<b>Gluster:</b> <code>{gluster_error_msg}</code>\n")
         else:
             # No Gluster info in server info.
-            hasError = True
+            statuses.append(ThresholdStatus.ERROR)
             stateIndicatingIcon = errorIcon
             gluster_error_msg = f"No gluster info in server info array"
-            serverReport += stateIndicatingIcon + f"<b>Gluster:</b> {wrap_with_code(gluster_error_msg)}\n"
+            parts.append(f"{stateIndicatingIcon}<b>Gluster:</b> <code>{gluster_error_msg}</code>\n")
 
 
         # Add Updates information.
         thresholds = self.get_thresholds('updates')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['updates']['amount_of_available_updates'])
-        if system_value > float(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > float(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        updates_info = f"{self.server_info_array['updates']['amount_of_available_updates']} " \
-                    f"({self.server_info_array['updates']['updates_available_output']})"
-        serverReport += stateIndicatingIcon + f"<b>Available Updates:</b> {wrap_with_code(updates_info)}\n"
+        system_value = self._parsed['updates']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        updates_info = info['updates']
+        updates_info_str = f"{updates_info['amount_of_available_updates']} " \
+                    f"({updates_info['updates_available_output']})"
+        parts.append(f"{stateIndicatingIcon}<b>Available Updates:</b> <code>{updates_info_str}</code>\n")
 
         # Add Kernel information (if available in JSON).
-        if 'kernel' in self.server_info_array:
+        if 'kernel' in info:
+            kernel_info = info['kernel']
             stateIndicatingIcon = ""
-            versions_behind = int(self.server_info_array['kernel'].get('versions_behind', 0))
+            versions_behind = self._parsed['kernel_versions_behind']
             try:
                 thresholds = self.get_thresholds('kernel_versions_behind')
-                if versions_behind >= int(float(thresholds.error)) and int(float(thresholds.error)) != 0:
-                    hasError = True
-                    stateIndicatingIcon = errorIcon
-                elif versions_behind >= int(float(thresholds.warning)) and int(float(thresholds.warning)) != 0:
-                    hasWarning = True
-                    stateIndicatingIcon = warningIcon
+                status = _threshold_status(versions_behind, thresholds, operator.ge, nonzero_guard=True, integer=True)
+                statuses.append(status)
+                stateIndicatingIcon = _ICON_BY_STATUS[status]
             except Exception:
                 pass
-            running = self.server_info_array['kernel'].get('running_kernel', 'unknown')
-            installed = self.server_info_array['kernel'].get('installed_version', 'unknown')
-            candidate = self.server_info_array['kernel'].get('candidate_version', 'unknown')
+            running = kernel_info.get('running_kernel', 'unknown')
+            installed = kernel_info.get('installed_version', 'unknown')
+            candidate = kernel_info.get('candidate_version', 'unknown')
             if versions_behind > 0:
                 kernel_info_str = f"{running} ({installed} → {candidate}, {versions_behind} behind)"
             else:
                 kernel_info_str = f"{running} (up to date)"
-            serverReport += stateIndicatingIcon + f"<b>Kernel:</b> {wrap_with_code(kernel_info_str)}\n"
+            parts.append(f"{stateIndicatingIcon}<b>Kernel:</b> <code>{kernel_info_str}</code>\n")
 
         # Add System Restart information with an if-else statement.
-        thresholds = self.get_thresholds('system_restart')
-        stateIndicatingIcon = ""
-        system_value = float(self.server_info_array['system_restart']['time_elapsed_seconds'])
-        if system_value > timeStringUtils.convert_time_string_to_seconds(thresholds.error):
-            hasError = True
-            stateIndicatingIcon = errorIcon
-        elif system_value > timeStringUtils.convert_time_string_to_seconds(thresholds.warning):
-            hasWarning = True
-            stateIndicatingIcon = warningIcon
-        restart_info = "No system restart required" if self.server_info_array['system_restart']['status'] == 'No restart required' else \
-            f"System restart required for {wrap_with_code(self.server_info_array['system_restart']['time_elapsed_human_readable'])}"
-        serverReport += stateIndicatingIcon + f"<b>System Restart:</b> {wrap_with_code(restart_info)}\n"
+        # get_thresholds() only runs (and raises KeyError) if system_restart is not configured.
+        thresholds = self._restart_thresholds_seconds or self.get_thresholds('system_restart')
+        system_value = self._parsed['restart_elapsed_seconds']
+        status = _threshold_status(system_value, thresholds)
+        statuses.append(status)
+        stateIndicatingIcon = _ICON_BY_STATUS[status]
+        restart_info = info['system_restart']
+        restart_info_str = "No system restart required" if restart_info['status'] == 'No restart required' else \
+            f"System restart required for <code>{restart_info['time_elapsed_human_readable']}</code>"
+        parts.append(f"{stateIndicatingIcon}<b>System Restart:</b> <code>{restart_info_str}</code>\n")
 
         # Add Linux Server State Tool information.
         tool_info = ""
         thresholds = self.get_thresholds('linux_server_state_tool')
         stateIndicatingIcon = ""
+        state_tool = info['linux_server_state_tool']
         # Check remote connection.
-        if self.server_info_array['linux_server_state_tool']['repo_accessible'] == "true":
+        if state_tool['repo_accessible'] == "true":
 
             # Check local changes.
-            if self.server_info_array['linux_server_state_tool']['local_changes'] == "Yes":
+            if state_tool['local_changes'] == "Yes":
                 tool_info += "Uncommitted local changes, "
 
             # Is repo up to date?
-            git_behind_count = int(self.server_info_array['linux_server_state_tool']['behind_count'])
+            git_behind_count = self._parsed['tool_behind_count']
             if git_behind_count > 0:
-                
-                system_value = float(self.server_info_array['linux_server_state_tool']['behind_count'])
-                if system_value > float(thresholds.error):
-                    hasError = True
-                    stateIndicatingIcon = errorIcon
-                elif system_value > float(thresholds.warning):
-                    hasWarning = True
-                    stateIndicatingIcon = warningIcon
+                status = _threshold_status(git_behind_count, thresholds)
+                statuses.append(status)
+                stateIndicatingIcon = _ICON_BY_STATUS[status]
 
                 tool_info += f"Repo updateable. {git_behind_count} commits behind."
             else:
                 tool_info += f"Tool is up to date"
         else:
-            tool_info += "Remote repo Not accessible!! Check connection!! repo_accessible: " + self.server_info_array['linux_server_state_tool']['repo_accessible'] 
+            tool_info += "Remote repo Not accessible!! Check connection!! repo_accessible: " + state_tool['repo_accessible'] 
 
-        serverReport += f"<b>Linux Server State Tool:</b> {wrap_with_code(tool_info)}\n"
+        parts.append(f"<b>Linux Server State Tool:</b> <code>{tool_info}</code>\n")
 
         
         # Hardware Metrics (with error handling)
-        if 'hardware' in self.server_info_array:
+        if 'hardware' in info:
+            hardware_info = info['hardware']
             # CPU Temperature
             thresholds = self.get_thresholds('temperature_cpu')
             stateIndicatingIcon = ""
-            cpu_temp_str = self.server_info_array['hardware'].get('cpu_temperature_celsius', 'N/A')
+            cpu_temp_str = hardware_info.get('cpu_temperature_celsius', 'N/A')
             if cpu_temp_str != 'N/A' and 'not available' not in cpu_temp_str.lower():
                 try:
                     system_value = float(cpu_temp_str)
-                    if system_value >= float(thresholds.error):
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning):
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
+                    status = _threshold_status(system_value, thresholds, operator.ge)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
                 except (ValueError, TypeError):
                     pass
-            serverReport += stateIndicatingIcon + f"<b>CPU Temperature:</b> {wrap_with_code(cpu_temp_str)}°C\n"
+            parts.append(f"{stateIndicatingIcon}<b>CPU Temperature:</b> <code>{cpu_temp_str}</code>°C\n")
 
             # Fan Speed
-            fan_speed_str = self.server_info_array['hardware'].get('fan_speed_rpm', 'N/A')
+            fan_speed_str = hardware_info.get('fan_speed_rpm', 'N/A')
             stateIndicatingIcon = ""
             if fan_speed_str != 'N/A' and 'not available' not in fan_speed_str.lower():
                 thresholds = self.get_thresholds('fan_speed')
                 try:
                     system_value = float(fan_speed_str)
-                    if system_value <= float(thresholds.error) and float(thresholds.error) != 0:
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value <= float(thresholds.warning) and float(thresholds.warning) != 0:
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
+                    status = _threshold_status(system_value, thresholds, operator.le, nonzero_guard=True)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
                 except (ValueError, TypeError):
                     pass
-            serverReport += stateIndicatingIcon + f"<b>Fan Speed:</b> {wrap_with_code(fan_speed_str)} RPM\n"
+            parts.append(f"{stateIndicatingIcon}<b>Fan Speed:</b> <code>{fan_speed_str}</code> RPM\n")
 
             # GPU Temperature
-            gpu_temp_str = self.server_info_array['hardware'].get('gpu_temperature_celsius', 'N/A')
+            gpu_temp_str = hardware_info.get('gpu_temperature_celsius', 'N/A')
             if gpu_temp_str != 'N/A' and 'not available' not in gpu_temp_str.lower():
                 thresholds = self.get_thresholds('temperature_gpu')
                 stateIndicatingIcon = ""
                 try:
                     system_value = float(gpu_temp_str)
-                    if system_value >= float(thresholds.error):
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning):
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
+                    status = _threshold_status(system_value, thresholds, operator.ge)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
                 except (ValueError, TypeError):
                     pass
-            serverReport += stateIndicatingIcon + f"<b>GPU Temperature:</b> {wrap_with_code(gpu_temp_str)}°C\n"
+            parts.append(f"{stateIndicatingIcon}<b>GPU Temperature:</b> <code>{gpu_temp_str}</code>°C\n")
 
         # Performance Metrics
         # I/O Wait
-        if 'io_wait' in self.server_info_array:
+        if 'io_wait' in info:
+            io_wait_info = info['io_wait']
             thresholds = self.get_thresholds('io_wait')
             stateIndicatingIcon = ""
-            io_wait_str = self.server_info_array['io_wait'].get('io_wait_percentage', 'N/A')
+            io_wait_str = io_wait_info.get('io_wait_percentage', 'N/A')
             if io_wait_str != 'N/A':
                 try:
                     system_value = float(io_wait_str)
-                    if system_value >= float(thresholds.error):
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning):
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
+                    status = _threshold_status(system_value, thresholds, operator.ge)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
                 except (ValueError, TypeError):
                     pass
-            serverReport += stateIndicatingIcon + f"<b>I/O Wait:</b> {wrap_with_code(io_wait_str)}%\n"
+            parts.append(f"{stateIndicatingIcon}<b>I/O Wait:</b> <code>{io_wait_str}</code>%\n")
 
         # System Load - informational only, no threshold alerting (CPU Usage % already covers this)
-        if 'system_load' in self.server_info_array:
-            load_1min_str = self.server_info_array['system_load'].get('load_1min', 'N/A')
-            load_5min_str = self.server_info_array['system_load'].get('load_5min', 'N/A')
-            load_15min_str = self.server_info_array['system_load'].get('load_15min', 'N/A')
-            norm_15_str = self.server_info_array['system_load'].get('normalized_15min_percent', 'N/A')
-            cpu_cores_str = self.server_info_array['system_load'].get('cpu_cores', 'N/A')
+        if 'system_load' in info:
+            system_load_info = info['system_load']
+            load_1min_str = system_load_info.get('load_1min', 'N/A')
+            load_5min_str = system_load_info.get('load_5min', 'N/A')
+            load_15min_str = system_load_info.get('load_15min', 'N/A')
+            norm_15_str = system_load_info.get('normalized_15min_percent', 'N/A')
+            cpu_cores_str = system_load_info.get('cpu_cores', 'N/A')
             load_info = f"{load_1min_str} (1min), {load_5min_str} (5min), {load_15min_str} (15min)"
             if norm_15_str != 'N/A' and cpu_cores_str != 'N/A':
                 load_info += f" | ~{norm_15_str}% utilized ({cpu_cores_str} cores)"
-            serverReport += f"<b>System Load:</b> {wrap_with_code(load_info)}\n"
+            parts.append(f"<b>System Load:</b> <code>{load_info}</code>\n")
 
         # File Descriptors
-        if 'file_descriptors' in self.server_info_array:
+        if 'file_descriptors' in info:
+            file_descriptors_info = info['file_descriptors']
             thresholds = self.get_thresholds('file_descriptors')
             stateIndicatingIcon = ""
-            fd_usage_str = self.server_info_array['file_descriptors'].get('usage_percent', 'N/A')
+            fd_usage_str = file_descriptors_info.get('usage_percent', 'N/A')
             if fd_usage_str != 'N/A':
                 try:
                     system_value = float(fd_usage_str)
-                    if system_value >= float(thresholds.error):
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning):
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
+                    status = _threshold_status(system_value, thresholds, operator.ge)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
                 except (ValueError, TypeError):
                     pass
-            fd_allocated = self.server_info_array['file_descriptors'].get('allocated', 'N/A')
-            fd_maximum = self.server_info_array['file_descriptors'].get('maximum', 'N/A')
+            fd_allocated = file_descriptors_info.get('allocated', 'N/A')
+            fd_maximum = file_descriptors_info.get('maximum', 'N/A')
             fd_info = f"{fd_usage_str}% ({fd_allocated} of {fd_maximum})"
-            serverReport += stateIndicatingIcon + f"<b>File Descriptors:</b> {wrap_with_code(fd_info)}\n"
+            parts.append(f"{stateIndicatingIcon}<b>File Descriptors:</b> <code>{fd_info}</code>\n")
 
         # Disk SMART Health
-        if 'disk_smart' in self.server_info_array:
-            smart_status = self.server_info_array['disk_smart'].get('status', 'N/A')
+        if 'disk_smart' in info:
+            disk_smart_info = info['disk_smart']
+            smart_status = disk_smart_info.get('status', 'N/A')
             stateIndicatingIcon = ""
             if smart_status == 'available':
-                devices = self.server_info_array['disk_smart'].get('devices', [])
+                devices = disk_smart_info.get('devices', [])
                 failed_count = 0
                 for device in devices:
                     if device.get('health') == 'failed':
                         failed_count += 1
                 thresholds = self.get_thresholds('smart_health_failed')
-                if failed_count >= int(float(thresholds.error)):
-                    hasError = True
-                    stateIndicatingIcon = errorIcon
-                elif failed_count >= int(float(thresholds.warning)):
-                    hasWarning = True
-                    stateIndicatingIcon = warningIcon
-            serverReport += stateIndicatingIcon + f"<b>Disk SMART:</b> {wrap_with_code(smart_status)}\n"
+                status = _threshold_status(failed_count, thresholds, operator.ge, integer=True)
+                statuses.append(status)
+                stateIndicatingIcon = _ICON_BY_STATUS[status]
+            parts.append(f"{stateIndicatingIcon}<b>Disk SMART:</b> <code>{smart_status}</code>\n")
 
         # Storage Arrays (ZFS/RAID)
-        if 'storage_arrays' in self.server_info_array:
-            zfs_status = self.server_info_array['storage_arrays'].get('zfs', {}).get('status', 'N/A')
-            raid_status = self.server_info_array['storage_arrays'].get('raid', {}).get('status', 'N/A')
+        if 'storage_arrays' in info:
+            storage_arrays_info = info['storage_arrays']
+            zfs_status = storage_arrays_info.get('zfs', {}).get('status', 'N/A')
+            raid_status = storage_arrays_info.get('raid', {}).get('status', 'N/A')
             stateIndicatingIcon = ""
             
             # Check ZFS
             if zfs_status == 'available':
-                pools = self.server_info_array['storage_arrays'].get('zfs', {}).get('pools', [])
+                pools = storage_arrays_info.get('zfs', {}).get('pools', [])
                 degraded_count = 0
                 for pool in pools:
                     if pool.get('health') not in ['ONLINE', 'healthy']:
                         degraded_count += 1
                 thresholds = self.get_thresholds('zfs_pool_degraded')
-                if degraded_count >= int(float(thresholds.error)):
-                    hasError = True
-                    stateIndicatingIcon = errorIcon
-                elif degraded_count >= int(float(thresholds.warning)):
-                    hasWarning = True
-                    stateIndicatingIcon = warningIcon
+                status = _threshold_status(degraded_count, thresholds, operator.ge, integer=True)
+                statuses.append(status)
+                stateIndicatingIcon = _ICON_BY_STATUS[status]
             
             # Check RAID
             if raid_status == 'available':
-                arrays = self.server_info_array['storage_arrays'].get('raid', {}).get('arrays', [])
+                arrays = storage_arrays_info.get('raid', {}).get('arrays', [])
                 degraded_count = 0
                 for array in arrays:
                     state = array.get('state', '').strip()
@@ -657,52 +658,96 @@ class ServerReportUtils:
                     if not is_healthy or is_degraded:
                         degraded_count += 1
                 thresholds = self.get_thresholds('raid_array_degraded')
-                if degraded_count >= int(float(thresholds.error)):
-                    hasError = True
-                    stateIndicatingIcon = errorIcon
-                elif degraded_count >= int(float(thresholds.warning)):
-                    hasWarning = True
-                    stateIndicatingIcon = warningIcon
+                # Keep the ZFS icon if RAID is healthy.
+                status = _threshold_status(degraded_count, thresholds, operator.ge, integer=True)
+                statuses.append(status)
+                stateIndicatingIcon = _ICON_BY_STATUS[status] or stateIndicatingIcon
             
-            serverReport += stateIndicatingIcon + f"<b>Storage Arrays:</b> {wrap_with_code(f'ZFS: {zfs_status}, RAID: {raid_status}')}\n"
+            parts.append(f"{stateIndicatingIcon}<b>Storage Arrays:</b> <code>ZFS: {zfs_status}, RAID: {raid_status}</code>\n")
 
         # NTP Sync
-        if 'ntp_sync' in self.server_info_array:
-            ntp_status = self.server_info_array['ntp_sync'].get('status', 'N/A')
-            ntp_offset = self.server_info_array['ntp_sync'].get('offset_ms', 'N/A')
+        if 'ntp_sync' in info:
+            ntp_sync_info = info['ntp_sync']
+            ntp_status = ntp_sync_info.get('status', 'N/A')
+            ntp_offset = ntp_sync_info.get('offset_ms', 'N/A')
             stateIndicatingIcon = ""
             
             if ntp_offset != 'N/A':
                 try:
                     thresholds = self.get_thresholds('ntp_offset_ms')
                     system_value = float(ntp_offset)
-                    if system_value >= float(thresholds.error):
-                        hasError = True
-                        stateIndicatingIcon = errorIcon
-                    elif system_value >= float(thresholds.warning):
-                        hasWarning = True
-                        stateIndicatingIcon = warningIcon
+                    status = _threshold_status(system_value, thresholds, operator.ge)
+                    statuses.append(status)
+                    stateIndicatingIcon = _ICON_BY_STATUS[status]
                 except (ValueError, TypeError):
                     pass
             
             ntp_info = f"{ntp_status}"
             if ntp_offset != 'N/A':
                 ntp_info += f" (offset: {ntp_offset}ms)"
-            serverReport += stateIndicatingIcon + f"<b>NTP Sync:</b> {wrap_with_code(ntp_info)}\n"
+            parts.append(f"{stateIndicatingIcon}<b>NTP Sync:</b> <code>{ntp_info}</code>\n")
 
         
         # Determine overall server state, adapt heading and concenate with rest of report.
+        hasError = ThresholdStatus.ERROR in statuses
+        hasWarning = ThresholdStatus.WARNING in statuses
         stateIndicatingIcon = ""
         if hasError == True:
             stateIndicatingIcon = errorIcon
         elif hasWarning == True:
             stateIndicatingIcon = warningIcon
-        serverHeading = stateIndicatingIcon + f"<b>Server Status Report</b> - {wrap_with_code(self.server_name)}\n"
-        serverReport = serverHeading + serverReport
+        serverHeading = f"{stateIndicatingIcon}<b>Server Status Report</b> - <code>{self.server_name}</code>\n"
+        serverReport = serverHeading + "".join(parts)
 
         return ServerReport(serverReport, hasWarning=hasWarning, hasError=hasError)
 
 
+    @staticmethod
+    def _parse_numeric_fields(server_info: dict) -> dict:
+        """Parse the numeric fields of system_info.json used for threshold checks.
+
+        Optional sections are only parsed under the same conditions the
+        report uses them, so unused values never raise.
+
+        Args:
+            server_info (dict): Parsed system_info.json.
+
+        Returns:
+            dict: Numeric values keyed by metric name.
+        """
+        parsed = {
+            'timestamp': int(server_info['timestamp']['unix_format']),
+            'cpu_pct': float(server_info['cpu']['last_15min_cpu_percentage'].strip().strip("%")),
+            'disk_pct': float(server_info['disk']['disk_usage_percentage'].strip().strip("%")),
+            'memory_pct': float(server_info['memory']['memory_usage_percentage'].strip().strip("%")),
+            'processes': float(server_info['processes']['amount_processes']),
+            'users': float(server_info['users']['logged_in_users']),
+            'updates': float(server_info['updates']['amount_of_available_updates']),
+            'restart_elapsed_seconds': float(server_info['system_restart']['time_elapsed_seconds']),
+        }
+
+        network = server_info.get('network')
+        if network and network['is_vnstab_installed'].upper() == "TRUE" and network['has_vnstab_enough_data'].upper() == "TRUE":
+            parsed['network_up'] = float(network['upstream_avg_bits'].strip())
+            parsed['network_down'] = float(network['downstream_avg_bits'].strip())
+            parsed['network_total'] = float(network['total_network_avg_bits'].strip())
+
+        gluster = server_info.get('gluster')
+        if gluster and gluster['is_gluster_installed'].upper() == "TRUE":
+            parsed['gluster_peers'] = int(gluster['number_of_peers'])
+            parsed['gluster_healthy_peers'] = int(gluster['number_of_healthy_peers'])
+            parsed['gluster_volumes'] = int(gluster['number_of_volumes'])
+            parsed['gluster_healthy_volumes'] = int(gluster['number_of_healthy_volumes'])
+
+        if 'kernel' in server_info:
+            parsed['kernel_versions_behind'] = int(server_info['kernel'].get('versions_behind', 0))
+
+        if server_info['linux_server_state_tool']['repo_accessible'] == "true":
+            parsed['tool_behind_count'] = int(server_info['linux_server_state_tool']['behind_count'])
+
+        return parsed
+
+
     def get_thresholds(self, thresholds_key: str) -> Thresholds:
         """Get threshold values for a specific metric from config.
 
@@ -711,5 +756,11 @@ class ServerReportUtils:
 
         Returns:
             Thresholds: Object with warning and error threshold values.
+
+        Raises:
+            KeyError: If the threshold key is not found.
         """
-        return self._config.get_thresholds(thresholds_key)
+        try:
+            return self._thresholds_cache[thresholds_key]
+        except KeyError:
+            raise KeyError(f"Threshold key '{thresholds_key}' not found in configuration.") from None
@@ -4,14 +4,19 @@
 import time
 # For file operations with operating system.
 import os
+# To send to several chats concurrently.
+import threading
+from concurrent.futures import ThreadPoolExecutor
+# To cache secret file reads.
+from functools import lru_cache
 # For creating files.
 import fileUtils
-# To interact with telgram bots.
-import telebot
+# telebot and requests are imported on first send (see _get_bot), so
+# deployments with telegram disabled never load them.
 
 ## Own classes.
 import stringUtils
-from watchdogConfig import get_config
+from watchdogConfig import get_config, is_truthy
 
 
 def _is_truthy_env(env_var_name: str) -> bool:
@@ -25,12 +30,107 @@ def _is_truthy_env(env_var_name: str) -> bool:
             truthy value (e.g. "1", "true", "yes"), otherwise False.
     """
 
-    value = os.getenv(env_var_name)
-    if value is None:
-        return False
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return is_truthy(os.getenv(env_var_name))
+
+
+@lru_cache(maxsize=8)
+def _read_secret(path: str, mtime_ns: int) -> str:
+    """Read and strip a secret file, cached per path and modification time.
+
+    Args:
+        path (str): Path to the secret file.
+        mtime_ns (int): File modification time; part of the cache key only.
+
+    Returns:
+        str: Stripped file content.
+    """
+
+    with open(path, "r") as secret_file:
+        return secret_file.read().strip()
+
+def _build_session():
+    """Create a pooled requests session with retries for the Telegram API.
+
+    Returns:
+        requests.Session: Session with a retrying HTTPAdapter mounted.
+    """
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # sendMessage is a non-idempotent POST: only connection attempts are
+    # retried, plus 429 (honouring Retry-After) for urllib3's default,
+    # idempotent methods, so an accepted message is never sent twice.
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[429],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session(stale=None):
+    """Return the shared session, replacing it if it is the given stale one."""
+
+    global _session
+    with _session_lock:
+        if _session is None or _session is stale:
+            if stale is not None:
+                stale.close()
+            _session = _build_session()
+        return _session
+
+
+def _send_request(method, url, **kwargs):
+    """Send telebot API requests over the shared session.
+
+    After a connection error the session is replaced for the next request,
+    instead of recreating the bot for every message. The failed request is
+    not re-sent, as Telegram may already have accepted it.
+    """
+
+    from requests.exceptions import ConnectionError as RequestsConnectionError
+
+    session = _get_session()
+    try:
+        return session.request(method, url, **kwargs)
+    except RequestsConnectionError:
+        _get_session(stale=session)
+        raise
+
+
+# Telegram allows about 30 messages per second per bot.
+_MAX_MESSAGES_PER_SECOND = 30
+_rate_lock = threading.Lock()
+_next_send_time = 0.0
+
+
+def _throttle():
+    """Block until the next message may be sent under the global rate cap."""
+
+    global _next_send_time
+    with _rate_lock:
+        now = time.monotonic()
+        if _next_send_time > now:
+            time.sleep(_next_send_time - now)
+            now = _next_send_time
+        _next_send_time = now + 1.0 / _MAX_MESSAGES_PER_SECOND
+
 
 # Load config from environment/watchdog.env.
+
 _config = get_config()
 
 # Fetch botToken from secret file, if existing.
@@ -39,8 +139,7 @@ BOT_TOKEN_FILE = os.getenv("botToken_FILE") or os.getenv("TELEGRAM_BOT_TOKEN_FIL
 
 if BOT_TOKEN_FILE:
     try:
-        with open(BOT_TOKEN_FILE, "r") as bot_token_file:
-            botToken = bot_token_file.read().strip()
+        botToken = _read_secret(BOT_TOKEN_FILE, os.stat(BOT_TOKEN_FILE).st_mtime_ns)
     except FileNotFoundError:
         botToken = ""
 
@@ -53,15 +152,27 @@ telegram_disabled = (
     or botToken.strip() in {"change_me_telegram_token", "CHANGE_ME_TELEGRAM_TOKEN"}
 )
 
-# Initialize telegram bot.
+# Telegram bot, created on first send.
 bot = None
-if not telegram_disabled:
-    bot = telebot.TeleBot(botToken, parse_mode="HTML")
+_bot_lock = threading.Lock()
+
+
+def _get_bot():
+    """Return the shared bot, importing telebot and creating it on first use."""
+
+    global bot
+    if bot is None:
+        with _bot_lock:
+            if bot is None:
+                import telebot
+                telebot.apihelper.CUSTOM_REQUEST_SENDER = _send_request
+                bot = telebot.TeleBot(botToken, parse_mode="HTML")
+    return bot
 
 # Telegram Chats were to send info, error and warnings to (loaded from config).
-errorChatIDs = []
-warningChatIDs = []
-infoChatIDs = []
+errorChatIDs = ()
+warningChatIDs = ()
+infoChatIDs = ()
 
 if not telegram_disabled:
     # Get chat IDs from config (already parsed and sanitized).
@@ -70,32 +181,51 @@ if not telegram_disabled:
     infoChatIDs = _config.info_chat_ids
 
     # Ensure, that there is at least one item in each chat-group.
-    if not any(errorChatIDs):
+    if not errorChatIDs:
         raise ValueError("At least one item is required in errorChatIDs.")
-    if not any(warningChatIDs):
+    if not warningChatIDs:
         raise ValueError("At least one item is required in warningChatIDs.")
-    if not any(infoChatIDs):
+    if not infoChatIDs:
         raise ValueError("At least one item is required in infoChatIDs.")
 
+# Worker threads for sending to several chats at once (started on demand).
+_SEND_POOL = ThreadPoolExecutor(
+    max_workers=max(1, min(8, len(errorChatIDs) + len(warningChatIDs) + len(infoChatIDs))),
+    thread_name_prefix="telegram-send",
+)
+
+
+def _broadcast(chatIDs, message):
+    """Send one message to all given chats concurrently.
+
+    The message is split once for all chats. Chunks stay in order, as each
+    chat is handled by a single task. Exceptions from any send are re-raised.
+    """
+
+    if telegram_disabled or not chatIDs:
+        return
+    chunks = _split_message(message)
+    if len(chatIDs) == 1:
+        _send_chunks(chatIDs[0], chunks)
+        return
+    list(_SEND_POOL.map(lambda chatID: _send_chunks(chatID, chunks), chatIDs))
+
 
 
 # Send Error message.
 def sendErrorMessage(errorMessage):
     """Send an error message to all configured Telegram error chats."""
-    for errorChatID in errorChatIDs:
-        sendMessage(errorChatID, errorMessage)
+    _broadcast(errorChatIDs, errorMessage)
 
 # Send Warning message.
 def sendWarningMessage(warningMessage):
     """Send a warning message to all configured Telegram warning chats."""
-    for warningChatID in warningChatIDs:
-        sendMessage(warningChatID, warningMessage)
+    _broadcast(warningChatIDs, warningMessage)
 
 # Send Info message.
 def sendInfoMessage(infoMessage):
     """Send an info message to all configured Telegram info chats."""
-    for infoChatID in infoChatIDs:
-        sendMessage(infoChatID, infoMessage)
+    _broadcast(infoChatIDs, infoMessage)
 
 # Send message using telegram.
 def sendMessage(chatID, message):
@@ -112,17 +242,22 @@ def sendMessage(chatID, message):
     if telegram_disabled:
         return
 
-    # Recreate bot to avoid timeout errors.
-    bot = telebot.TeleBot(botToken, parse_mode="HTML")
-    
+    _send_chunks(chatID, _split_message(message))
+
+
+def _split_message(message):
+    """Split a message into chunks within Telegram's 4096 character limit."""
+
     # Does message have to be split?
     if len(message) > 4096:
-        # Split message.
-        individualMessages = stringUtils.splitLongTextIntoWorkingMessages(message)
+        return stringUtils.splitLongTextIntoWorkingMessages(message)
+    return (message,)
+
 
-        # Send messages.
-        for individualMessage in individualMessages:
-            bot.send_message(chatID, individualMessage)
+def _send_chunks(chatID, chunks):
+    """Send pre-split message chunks to a single chat, in order."""
 
-    else:
-        bot.send_message(chatID, message)
+    sender = _get_bot()
+    for chunk in chunks:
+        _throttle()
+        sender.send_message(chatID, chunk)
@@ -17,13 +17,45 @@ Usage:
 
 import os
 import json
-from typing import Optional, Any
+import stat
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from dotenv import dotenv_values
 
+# Fast JSON parsing (optional, falls back to stdlib json)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Parsed env files: path -> ((st_ino, st_mtime_ns, st_size), values).
+# The values dicts are shared between instances and must not be mutated.
+_DOTENV_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Optional[str]]]] = {}
+
+# Whitespace and quotes trimmed from config values in a single strip() pass.
+_SANITIZE_CHARS = ' \t\n\r\v\f"'
+
+# Values treated as "enabled" for boolean settings.
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on", "t"})
+
+
+def is_truthy(value: Optional[str]) -> bool:
+    """Return True if a setting string is a typical truthy value (e.g. "1", "yes")."""
+    return value is not None and value.strip().lower() in _TRUTHY
+
+
+# Verbose config tracing, read once at import.
+_DEBUG = is_truthy(os.getenv("DEBUG_WATCHDOG_CONFIG"))
+
 
 class Thresholds:
     """Container for warning and error threshold values."""
 
+    __slots__ = ("warning", "error", "warning_float", "error_float")
+
     def __init__(self, warning: str, error: str):
         """Initialize threshold values.
 
@@ -33,6 +65,43 @@ class Thresholds:
         """
         self.warning = warning
         self.error = error
+        # Numeric views coerced once; None for non-numeric values (e.g. "7d").
+        self.warning_float = _to_float_or_none(warning)
+        self.error_float = _to_float_or_none(error)
+
+
+@lru_cache(maxsize=4)
+def _parse_json_cached(raw: str) -> Any:
+    """Parse a JSON config value, cached on the raw string.
+
+    The result is shared between calls; use _parse_json() to get a copy.
+    """
+    return _json_loads(raw)
+
+
+def _parse_json(raw: str) -> Any:
+    """Parse a JSON config value, returning a top-level copy safe to modify."""
+    parsed = _parse_json_cached(raw)
+    return dict(parsed) if isinstance(parsed, dict) else parsed
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """Return (st_ino, st_mtime_ns, st_size) of a regular file, else None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _to_float_or_none(value: str) -> Optional[float]:
+    """Convert a threshold string to float, returning None if not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
 
 class WatchdogConfig:
@@ -47,9 +116,10 @@ class WatchdogConfig:
         gluster_not_installed_handling (str): How to handle missing Gluster.
         message_frequency (dict): Info/warning/error message frequency.
         thresholds (dict): All threshold configurations.
-        error_chat_ids (list): Telegram chat IDs for errors.
-        warning_chat_ids (list): Telegram chat IDs for warnings.
-        info_chat_ids (list): Telegram chat IDs for info messages.
+        threshold_keys (frozenset): Keys accepted by get_thresholds().
+        error_chat_ids (tuple): Telegram chat IDs for errors.
+        warning_chat_ids (tuple): Telegram chat IDs for warnings.
+        info_chat_ids (tuple): Telegram chat IDs for info messages.
         admin_token (str): Admin authentication token for the web UI.
     """
 
@@ -113,17 +183,31 @@ class WatchdogConfig:
         self._load_config()
 
     def _load_env_file(self) -> None:
-        """Load values from the env file if it exists."""
-        print(f"DEBUG: Attempting to load env file: {self._env_file_path}")
-        if os.path.isfile(self._env_file_path):
+        """Load values from the env file if it exists.
+
+        The parsed values are cached per path and reused while the file's
+        inode, mtime and size are unchanged.
+        """
+        if _DEBUG:
+            print(f"DEBUG: Attempting to load env file: {self._env_file_path}")
+        signature = _file_signature(self._env_file_path)
+        self._env_file_signature = signature
+        if signature is not None:
             try:
-                self._file_values = dotenv_values(self._env_file_path)
-                print(f"DEBUG: Successfully loaded {len(self._file_values)} keys from {self._env_file_path}")
-                if "WATCHDOG_ADMIN_TOKEN" in self._file_values:
-                    print("DEBUG: Found WATCHDOG_ADMIN_TOKEN in file")
+                cached = _DOTENV_CACHE.get(self._env_file_path)
+                if cached is not None and cached[0] == signature:
+                    self._file_values = cached[1]
+                else:
+                    self._file_values = dotenv_values(self._env_file_path)
+                    _DOTENV_CACHE[self._env_file_path] = (signature, self._file_values)
+                if _DEBUG:
+                    print(f"DEBUG: Successfully loaded {len(self._file_values)} keys from {self._env_file_path}")
+                    if "WATCHDOG_ADMIN_TOKEN" in self._file_values:
+                        print("DEBUG: Found WATCHDOG_ADMIN_TOKEN in file")
             except Exception as e:
                 print(f"❌ Error: Could not load env file {self._env_file_path}: {e}")
                 self._file_values = {}
+                self._env_file_signature = None
         else:
             print(f"⚠️  Warning: Config file not found at {self._env_file_path}")
 
@@ -139,9 +223,11 @@ class WatchdogConfig:
         Returns:
             Optional[str]: File content (stripped) if available, else None.
         """
-        file_path = os.getenv(f"{key}_FILE")
+        file_path = self._env_snapshot.get(f"{key}_FILE")
         if not file_path:
             return None
+        # Remembered so is_current() notices a rotated secret file
+        self._secret_file_signatures[file_path] = _file_signature(file_path)
 
         try:
             if not os.path.isfile(file_path):
@@ -159,52 +245,77 @@ class WatchdogConfig:
         1. WATCHDOG_ADMIN_TOKEN: Environment > watchdog.env (Security/Lockout protection)
         2. Others: watchdog.env > Environment (UI update priority)
         """
-        env_val = self._read_env_file_value(key) or os.getenv(key)
+        env_val = self._read_env_file_value(key) or self._env_snapshot.get(key)
         file_val = self._file_values.get(key)
         
-        # Trace for critical keys
-        is_critical = "TOKEN" in key.upper() or "PATH" in key.upper()
+        # Trace for critical keys (only worked out when debug tracing is on)
+        is_critical = _DEBUG and ("TOKEN" in key.upper() or "PATH" in key.upper())
         
         # SECURITY EXCEPTION: Always prefer ENV for the Admin Token to prevent lockout
         # if the watchdog.env file gets corrupted or set to a default value.
-        if key == "WATCHDOG_ADMIN_TOKEN" and env_val is not None and env_val.strip() != "":
+        env_clean = env_val.strip(_SANITIZE_CHARS) if env_val is not None else ""
+        if key == "WATCHDOG_ADMIN_TOKEN" and env_clean:
             if is_critical:
                 print(f"DEBUG: Config {key} loaded from ENV (Security Priority): [MASKED]")
-            return env_val.strip().strip('"')
+            return env_clean
 
         # 1. Check File Value (Priority for updates via UI)
-        if file_val is not None and str(file_val).strip() != "":
-            val = str(file_val).strip().strip('"')
-            if is_critical:
-                print(f"DEBUG: Config {key} loaded from FILE: [MASKED]")
-            return val
+        # dotenv_values() yields str or None, so no str() coercion is needed.
+        if file_val is not None:
+            val = file_val.strip(_SANITIZE_CHARS)
+            if val:
+                if is_critical:
+                    print(f"DEBUG: Config {key} loaded from FILE: [MASKED]")
+                return val
 
         # 2. Check Environment Variable
-        if env_val is not None and env_val.strip() != "":
+        if env_clean:
             if is_critical:
                 masked = "[MASKED]" if "TOKEN" in key.upper() else env_val
                 print(f"DEBUG: Config {key} loaded from ENV: {masked}")
-            return env_val.strip().strip('"')
+            return env_clean
             
         # 3. Fallback to Default
-        if default is not None:
+        if _DEBUG and default is not None:
             # Only log if it's not the default "not found" value
             if not isinstance(default, str) or "not found" not in default.lower():
                 print(f"DEBUG: {key} not found, using default: {default}")
         return default
 
+    def _get_first_value(self, keys: tuple, default: Any = None) -> Any:
+        """Get the value of the first key in keys that is set.
+
+        Unlike nesting _get_value calls, fallback keys are only looked up
+        when the preferred key has no value.
+
+        Args:
+            keys (tuple): Keys to try, in order of preference.
+            default (Any, optional): Value returned when no key is set.
+
+        Returns:
+            Any: The first found value, or default.
+        """
+        for key in keys:
+            value = self._get_value(key)
+            if value is not None:
+                return value
+        return default
+
     def _load_config(self) -> None:
         """Load all configuration values."""
+        # Snapshot the environment once per load; reload() takes a new one.
+        self._env_snapshot = dict(os.environ)
+        self._to_dict_cache: Optional[Mapping[str, Any]] = None
+        self._secret_file_signatures: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
         # Server identification
-        self.server_name = self._get_value(
-            "serverName",
-            self._get_value("SERVER_NAME", "Unknown - Please set serverName"),
+        self.server_name = self._get_first_value(
+            ("serverName", "SERVER_NAME"), "Unknown - Please set serverName"
         )
 
         # Gluster handling
-        self.gluster_not_installed_handling = self._get_value(
-            "gluster_not_installed_handling",
-            self._get_value("GLUSTER_NOT_INSTALLED_HANDLING", "error"),
+        self.gluster_not_installed_handling = self._get_first_value(
+            ("gluster_not_installed_handling", "GLUSTER_NOT_INSTALLED_HANDLING"), "error"
         )
 
         # Load thresholds from JSON env var or use defaults
@@ -217,13 +328,12 @@ class WatchdogConfig:
         self._load_chat_ids()
 
         # Admin token for web UI
-        self.admin_token = self._get_value(
-            "WATCHDOG_ADMIN_TOKEN",
-            self._get_value("watchdog_admin_token", ""),
+        self.admin_token = self._get_first_value(
+            ("WATCHDOG_ADMIN_TOKEN", "watchdog_admin_token"), ""
         )
         
         # Debug logging for config loading
-        if os.getenv("DEBUG_WATCHDOG_CONFIG", "false").lower() in ("true", "1", "yes"):
+        if _DEBUG:
             print(f"DEBUG: WatchdogConfig loaded from {self._env_file_path}")
             print(f"DEBUG: server_name={self.server_name}")
             print(f"DEBUG: admin_token_set={'Yes' if self.admin_token else 'No'}")
@@ -246,14 +356,13 @@ class WatchdogConfig:
         """
         thresholds_json = self._get_value("WATCHDOG_THRESHOLDS_JSON", "")
 
+        loaded = {}
         if thresholds_json:
             try:
-                loaded = json.loads(thresholds_json)
+                loaded = _parse_json(thresholds_json)
             except json.JSONDecodeError as e:
                 print(f"Warning: Invalid WATCHDOG_THRESHOLDS_JSON: {e}")
                 print("Using default thresholds.")
-                self.thresholds = self.DEFAULT_THRESHOLDS.copy()
-                return
 
             # Migrate deprecated keys
             for old_key, new_key in self._THRESHOLD_MIGRATIONS.items():
@@ -262,11 +371,25 @@ class WatchdogConfig:
                 elif old_key in loaded and new_key in loaded:
                     del loaded[old_key]
 
-            # Merge: start with defaults, then overlay loaded values
-            self.thresholds = self.DEFAULT_THRESHOLDS.copy()
-            self.thresholds.update(loaded)
-        else:
-            self.thresholds = self.DEFAULT_THRESHOLDS.copy()
+        # Merge: start with defaults, then overlay loaded values. The inner
+        # dicts are copied so the class defaults and the cached JSON parse
+        # are never shared with (and mutated through) an instance.
+        self.thresholds = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in {**self.DEFAULT_THRESHOLDS, **loaded}.items()
+        }
+
+        # Threshold objects built once per load and shared by get_thresholds()
+        self._threshold_objs = {
+            key: Thresholds(
+                warning=str(value.get("warning", "0")),
+                error=str(value.get("error", "0")),
+            )
+            for key, value in self.thresholds.items()
+            if isinstance(value, dict)
+        }
+        # Keys get_thresholds() can resolve, for check-before-get callers
+        self.threshold_keys = frozenset(self._threshold_objs)
 
     def _load_message_frequency(self) -> None:
         """Load message frequency configuration from JSON env var or defaults."""
@@ -274,7 +397,7 @@ class WatchdogConfig:
 
         if freq_json:
             try:
-                self.message_frequency = json.loads(freq_json)
+                self.message_frequency = _parse_json(freq_json)
             except json.JSONDecodeError as e:
                 print(f"Warning: Invalid WATCHDOG_MESSAGE_FREQUENCY_JSON: {e}")
                 print("Using default message frequency.")
@@ -282,33 +405,35 @@ class WatchdogConfig:
         else:
             self.message_frequency = self.DEFAULT_MESSAGE_FREQUENCY.copy()
 
-    def _load_chat_ids(self) -> None:
-        """Load Telegram chat IDs from env vars."""
-        # Error chat IDs
-        error_ids_str = self._get_value("errorChatIDs", self._get_value("ERROR_CHAT_IDS", ""))
-        self.error_chat_ids = self._parse_chat_ids(error_ids_str)
-
-        # Warning chat IDs
-        warning_ids_str = self._get_value("warningChatIDs", self._get_value("WARNING_CHAT_IDS", ""))
-        self.warning_chat_ids = self._parse_chat_ids(warning_ids_str)
+    # Chat ID attributes and the env keys they are read from (preferred, fallback).
+    _CHAT_ID_KEYS = (
+        ("error_chat_ids", "errorChatIDs", "ERROR_CHAT_IDS"),
+        ("warning_chat_ids", "warningChatIDs", "WARNING_CHAT_IDS"),
+        ("info_chat_ids", "infoChatIDs", "INFO_CHAT_IDS"),
+    )
 
-        # Info chat IDs
-        info_ids_str = self._get_value("infoChatIDs", self._get_value("INFO_CHAT_IDS", ""))
-        self.info_chat_ids = self._parse_chat_ids(info_ids_str)
+    def _load_chat_ids(self) -> None:
+        """Load Telegram chat IDs (error, warning, info) from env vars."""
+        for attr_name, key, fallback_key in self._CHAT_ID_KEYS:
+            ids_str = self._get_first_value((key, fallback_key), "")
+            setattr(self, attr_name, self._parse_chat_ids(ids_str))
 
-    def _parse_chat_ids(self, chat_ids_string: str) -> list:
-        """Parse a comma-separated string of chat IDs into a list.
+    def _parse_chat_ids(self, chat_ids_string: str) -> tuple:
+        """Parse a comma-separated string of chat IDs into a tuple.
 
         Args:
             chat_ids_string (str): Comma-separated chat IDs.
 
         Returns:
-            list: List of sanitized chat ID strings.
+            tuple: Sanitized chat ID strings.
         """
         if not chat_ids_string:
-            return []
-        ids = chat_ids_string.split(",")
-        return [cid.strip().strip('"') for cid in ids if cid.strip()]
+            return ()
+        return tuple(
+            chat_id
+            for cid in chat_ids_string.split(",")
+            if (chat_id := cid.strip(_SANITIZE_CHARS))
+        )
 
     def get_thresholds(self, key: str) -> Thresholds:
         """Get threshold values for a specific metric.
@@ -322,14 +447,10 @@ class WatchdogConfig:
         Raises:
             KeyError: If the threshold key is not found.
         """
-        if key not in self.thresholds:
-            raise KeyError(f"Threshold key '{key}' not found in configuration.")
-
-        threshold_data = self.thresholds[key]
-        return Thresholds(
-            warning=str(threshold_data.get("warning", "0")),
-            error=str(threshold_data.get("error", "0")),
-        )
+        try:
+            return self._threshold_objs[key]
+        except KeyError:
+            raise KeyError(f"Threshold key '{key}' not found in configuration.") from None
 
     def get_message_frequency(self, level: str) -> str:
         """Get message frequency for a specific level.
@@ -350,51 +471,80 @@ class WatchdogConfig:
         """
         return self._env_file_path
 
+    def is_current(self) -> bool:
+        """Check whether a reload would produce the same configuration.
+
+        An in-place rewrite that keeps inode, mtime and size goes unnoticed;
+        callers that just wrote the file should use reload_config(force=True).
+
+        Returns:
+            bool: True if neither the env file, the *_FILE secrets read during
+                the load (inode, mtime, size) nor the process environment
+                changed since the last load.
+        """
+        return (
+            _file_signature(self._env_file_path) == self._env_file_signature
+            and os.environ == self._env_snapshot
+            and all(
+                _file_signature(path) == signature
+                for path, signature in self._secret_file_signatures.items()
+            )
+        )
+
     def reload(self) -> None:
         """Reload configuration from the env file and environment variables."""
         self._load_env_file()
         self._load_config()
 
-    def to_dict(self) -> dict:
-        """Export current configuration as a dictionary.
+    def to_dict(self) -> Mapping[str, Any]:
+        """Export current configuration as a read-only mapping.
+
+        The mapping is built once per load and shared; reload() invalidates it.
 
         Returns:
-            dict: All configuration values.
+            Mapping[str, Any]: All configuration values.
         """
-        return {
-            "server_name": self.server_name,
-            "gluster_not_installed_handling": self.gluster_not_installed_handling,
-            "thresholds": self.thresholds,
-            "message_frequency": self.message_frequency,
-            "error_chat_ids": self.error_chat_ids,
-            "warning_chat_ids": self.warning_chat_ids,
-            "info_chat_ids": self.info_chat_ids,
-            "admin_token": "***" if self.admin_token else "",
-        }
+        if self._to_dict_cache is None:
+            self._to_dict_cache = MappingProxyType({
+                "server_name": self.server_name,
+                "gluster_not_installed_handling": self.gluster_not_installed_handling,
+                "thresholds": self.thresholds,
+                "message_frequency": self.message_frequency,
+                "error_chat_ids": self.error_chat_ids,
+                "warning_chat_ids": self.warning_chat_ids,
+                "info_chat_ids": self.info_chat_ids,
+                "admin_token": "***" if self.admin_token else "",
+            })
+        return self._to_dict_cache
 
 
 # Global singleton instance for convenience
-_config_instance: Optional[WatchdogConfig] = None
-
-
+@cache
 def get_config() -> WatchdogConfig:
     """Get the global WatchdogConfig singleton instance.
 
     Returns:
         WatchdogConfig: The global configuration instance.
     """
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = WatchdogConfig()
-    return _config_instance
+    return WatchdogConfig()
 
 
-def reload_config() -> WatchdogConfig:
+def reload_config(force: bool = False) -> WatchdogConfig:
     """Reload the global configuration and return the updated instance.
 
+    The existing instance is kept when the env file and environment are
+    unchanged since it was loaded, unless force is set.
+
+    Args:
+        force (bool): Always re-read the env file, bypassing the change checks
+            and the parsed env file cache (e.g. right after writing it).
+
     Returns:
         WatchdogConfig: The reloaded configuration instance.
     """
-    global _config_instance
-    _config_instance = WatchdogConfig()
-    return _config_instance
+    if force:
+        _DOTENV_CACHE.clear()
+    elif get_config().is_current():
+        return get_config()
+    get_config.cache_clear()
+    return get_config()